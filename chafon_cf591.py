@@ -14,7 +14,7 @@ implementing ALL available API functions for:
 - And more...
 
 Requirements:
-    - Python 3.6+
+    - Python 3.7+
     - ctypes (built-in)
     - libCFApi.so library installed
 
@@ -43,17 +43,22 @@ Usage:
 Author: Auto-generated from CHAFON CF591 SDK
 """
 
+import contextlib
 import ctypes
 import ctypes.util
 from ctypes import (
     Structure, POINTER, c_int64, c_char_p, c_int, c_ubyte, c_ushort, 
-    c_short, c_ulong, c_uint, c_void_p, byref, sizeof, cast
+    c_short, c_long, c_ulong, c_uint, c_void_p, byref, sizeof, cast
 )
 import os
+import socket
+import struct
 import sys
 import time
 import threading
-from typing import Optional, List, Dict, Generator, Callable, Any
+from array import array
+from collections import deque
+from typing import Optional, List, Dict, FrozenSet, Generator, Callable, Any
 from enum import IntEnum
 from dataclasses import dataclass
 
@@ -91,6 +96,16 @@ class StatusCode(IntEnum):
     CMD_RESP_CRC_ERR = 0xFFFFFF18      # Reader/writer response CRC error
 
 
+# Plain int -> name map for formatting error messages without going
+# through the IntEnum constructor
+_STATUS_NAMES = {int(code): code.name for code in StatusCode}
+
+# Plain-int status values for per-call checks (no IntEnum comparison)
+_OK = int(StatusCode.OK)
+_NO_TAG_CODES = frozenset((int(StatusCode.CMD_INVENTORY_STOP),
+                           int(StatusCode.CMD_COMM_TIMEOUT)))
+
+
 class MemoryBank(IntEnum):
     """Tag Memory Banks"""
     RESERVED = 0x00   # Reserved memory (Kill Password, Access Password)
@@ -159,6 +174,29 @@ class TagInfo(Structure):
         ("codeLen", c_ubyte),       # EPC code length in bytes
         ("code", c_ubyte * 255)     # EPC code data
     ]
+    
+    def to_tuple(self) -> tuple:
+        """
+        Decode all fields in one pass
+        
+        Returns:
+            (NO, rssi, antenna, channel, crc, pc, epc) with crc/pc/epc as
+            bytes and epc trimmed to codeLen
+        """
+        # Copy the struct out once (one memcpy) and parse the copy, rather
+        # than going through a ctypes descriptor for every field
+        raw = bytes(self)
+        no, rssi, antenna, channel, crc, pc, length = _TAG_HEADER.unpack_from(raw)
+        return (no, rssi, antenna, channel, crc, pc,
+                raw[_TAG_CODE_OFFSET:_TAG_CODE_OFFSET + length])
+
+
+# Fixed header of TagInfo (NO, rssi, antenna, channel, crc, pc, codeLen);
+# the EPC follows at _TAG_CODE_OFFSET. One unpack_from() is much cheaper
+# than reading each ctypes field through its descriptor.
+_TAG_HEADER = struct.Struct('<HhBB2s2sB')
+_TAG_CODE_OFFSET = TagInfo.code.offset
+_TAG_LEN_OFFSET = TagInfo.codeLen.offset
 
 
 class TagResp(Structure):
@@ -245,6 +283,10 @@ class NetInfo(Structure):
     ]
 
 
+# NetInfo as (IP, MAC, PORT big-endian, NetMask, Gateway) in one unpack
+_NET_INFO = struct.Struct('>4s6sH4s4s')
+
+
 class WiFiPara(Structure):
     """WiFi parameters structure"""
     _fields_ = [
@@ -256,6 +298,10 @@ class WiFiPara(Structure):
     ]
 
 
+# WiFiPara as (wifiEn, SSID, PASSWORD, IP, PORT big-endian) in one unpack
+_WIFI_PARA = struct.Struct('>B32s64s4sH')
+
+
 class SelectSortParam(Structure):
     """Select/Sort parameters for tag filtering"""
     _fields_ = [
@@ -350,6 +396,10 @@ class RssiPara(Structure):
 @dataclass
 class Tag:
     """Python-friendly tag data structure"""
+    # No per-instance __dict__: tags are created at inventory rate
+    __slots__ = ('epc', 'epc_bytes', 'rssi', 'antenna', 'channel',
+                 'crc', 'pc', 'length', 'sequence')
+    
     epc: str                    # EPC code as hex string
     epc_bytes: bytes            # EPC as raw bytes
     rssi: float                 # Signal strength in dBm
@@ -363,19 +413,39 @@ class Tag:
     @classmethod
     def from_tag_info(cls, tag_info: TagInfo) -> 'Tag':
         """Create Tag from C TagInfo structure"""
-        epc_bytes = bytes(tag_info.code[:tag_info.codeLen])
+        no, rssi, antenna, channel, crc, pc, epc_bytes = tag_info.to_tuple()
         return cls(
-            epc=''.join(f'{b:02X}' for b in epc_bytes),
+            epc=epc_bytes.hex().upper(),
             epc_bytes=epc_bytes,
-            rssi=tag_info.rssi / 10.0,
-            antenna=tag_info.antenna,
-            channel=tag_info.channel,
-            crc=bytes(tag_info.crc).hex().upper(),
-            pc=bytes(tag_info.pc).hex().upper(),
-            length=tag_info.codeLen,
-            sequence=tag_info.NO
+            rssi=rssi / 10.0,
+            antenna=antenna,
+            channel=channel,
+            crc=crc.hex().upper(),
+            pc=pc.hex().upper(),
+            length=len(epc_bytes),
+            sequence=no
         )
     
+    @staticmethod
+    def dict_from_tag_info(tag_info: TagInfo) -> Dict[str, Any]:
+        """
+        Build the to_dict() representation straight from a C TagInfo structure
+        
+        Skips the intermediate Tag object for callers that only want dicts.
+        """
+        no, rssi, antenna, channel, crc, pc, epc_bytes = tag_info.to_tuple()
+        return {
+            'epc': epc_bytes.hex().upper(),
+            'epc_bytes': epc_bytes,
+            'rssi': rssi / 10.0,
+            'antenna': antenna,
+            'channel': channel,
+            'crc': crc.hex().upper(),
+            'pc': pc.hex().upper(),
+            'length': len(epc_bytes),
+            'sequence': no
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -391,6 +461,54 @@ class Tag:
         }
 
 
+class TagBatch:
+    """
+    Batch of tag reads stored column-wise (one compact array per field)
+    
+    Cheaper than a list of Tag objects for bulk reads: no per-tag object
+    is created, and each column is a contiguous array that can be handed
+    straight to array/numpy code (e.g. numpy.frombuffer(batch.rssi, 'f4')).
+    EPCs of all tags are packed back-to-back in epc_data; tag i occupies
+    epc_data[epc_offsets[i]:epc_offsets[i] + length[i]].
+    """
+    __slots__ = ('rssi', 'antenna', 'channel', 'length', 'sequence',
+                 'epc_offsets', 'epc_data')
+    
+    def __init__(self):
+        self.rssi = array('f')          # Signal strength in dBm
+        self.antenna = array('B')       # Antenna number
+        self.channel = array('B')       # Frequency channel
+        self.length = array('B')        # EPC length in bytes
+        self.sequence = array('H')      # Tag sequence number
+        self.epc_offsets = array('I')   # Start of each EPC in epc_data
+        self.epc_data = bytearray()     # Packed EPC bytes
+    
+    def append_tag_info(self, tag_info: TagInfo):
+        """Append one C TagInfo structure to the batch"""
+        no, rssi, antenna, channel, _, _, length = _TAG_HEADER.unpack_from(tag_info)
+        self.rssi.append(rssi / 10.0)
+        self.antenna.append(antenna)
+        self.channel.append(channel)
+        self.length.append(length)
+        self.sequence.append(no)
+        self.epc_offsets.append(len(self.epc_data))
+        self.epc_data += memoryview(tag_info.code)[:length]
+    
+    def __len__(self) -> int:
+        return len(self.length)
+    
+    def epc_bytes(self, index: int) -> bytes:
+        """Get the EPC of tag `index` as raw bytes"""
+        start = self.epc_offsets[index]
+        return bytes(self.epc_data[start:start + self.length[index]])
+    
+    def epcs(self) -> List[str]:
+        """Get all EPCs as upper-case hex strings"""
+        data = self.epc_data
+        return [data[start:start + length].hex().upper()
+                for start, length in zip(self.epc_offsets, self.length)]
+
+
 # ============================================================================
 # Exception Classes
 # ============================================================================
@@ -400,7 +518,13 @@ class CF591Error(Exception):
     def __init__(self, message: str, error_code: int = None):
         self.error_code = error_code
         self.message = message
-        super().__init__(f"{message} (Error: 0x{error_code:08X})" if error_code else message)
+        if error_code:
+            # API results arrive as signed ints; show them as the unsigned
+            # StatusCode values
+            code = error_code & 0xFFFFFFFF
+            name = _STATUS_NAMES.get(code, 'UNKNOWN')
+            message = f"{message} (Error: 0x{code:08X} {name})"
+        super().__init__(message)
 
 
 class ConnectionError(CF591Error):
@@ -422,52 +546,136 @@ class TagError(CF591Error):
 # Library Loader
 # ============================================================================
 
+# C function prototypes: (name, argtypes, restype)
+# Applied once when the library is first loaded, not per reader instance
+_PROTOTYPES = [
+    # Connection functions
+    ('OpenDevice', [POINTER(c_int64), c_char_p, c_int], c_int),
+    ('OpenNetConnection', [POINTER(c_int64), c_char_p, c_ushort, c_long], c_int),
+    ('CloseDevice', [c_int64], c_int),
+
+    # Device info functions
+    ('GetInfo', [c_int64, POINTER(DeviceInfo)], c_int),
+    ('GetDeviceInfo', [c_int64, POINTER(DeviceFullInfo)], c_int),
+    ('GetDevicePara', [c_int64, POINTER(DevicePara)], c_int),
+    ('SetDevicePara', [c_int64, DevicePara], c_int),
+    ('RebootDevice', [c_int64], c_int),
+
+    # Inventory functions
+    ('InventoryContinue', [c_int64, c_ubyte, c_ulong], c_int),
+    ('GetTagUii', [c_int64, POINTER(TagInfo), c_ushort], c_int),
+    ('InventoryStop', [c_int64, c_ushort], c_int),
+
+    # Power functions
+    ('GetRFPower', [c_int64, POINTER(c_ubyte), POINTER(c_ubyte)], c_int),
+    ('SetRFPower', [c_int64, c_ubyte, c_ubyte], c_int),
+    ('GetAntPower', [c_int64, POINTER(AntPower)], c_int),
+    ('SetAntPower', [c_int64, AntPower], c_int),
+
+    # Frequency functions
+    ('GetFreq', [c_int64, POINTER(FreqInfo)], c_int),
+    ('SetFreq', [c_int64, POINTER(FreqInfo)], c_int),
+
+    # Antenna functions
+    ('GetAntenna', [c_int64, POINTER(c_ubyte)], c_int),
+    ('SetAntenna', [c_int64, POINTER(c_ubyte)], c_int),
+
+    # Tag operations
+    ('ReadTag', [c_int64, c_ubyte, POINTER(c_ubyte), c_ubyte, c_ushort, c_ubyte], c_int),
+    ('GetReadTagResp', [c_int64, POINTER(TagResp), POINTER(c_ubyte), POINTER(c_ubyte), c_ushort], c_int),
+    ('WriteTag', [c_int64, c_ubyte, POINTER(c_ubyte), c_ubyte, c_ushort, c_ubyte, POINTER(c_ubyte)], c_int),
+    ('GetTagResp', [c_int64, c_ushort, POINTER(TagResp), c_ushort], c_int),
+    ('LockTag', [c_int64, POINTER(c_ubyte), c_ubyte, c_ubyte], c_int),
+    ('KillTag', [c_int64, POINTER(c_ubyte)], c_int),
+
+    # Select/Sort/Query functions
+    ('SetSelectMask', [c_int64, c_ushort, c_ubyte, POINTER(c_ubyte)], c_int),
+    ('SelectOrSortGet', [c_int64, c_ubyte, POINTER(SelectSortParam)], c_int),
+    ('SelectOrSortSet', [c_int64, c_ubyte, POINTER(SelectSortParam)], c_int),
+    ('QueryCfgGet', [c_int64, c_ubyte, POINTER(QueryParam)], c_int),
+    ('QueryCfgSet', [c_int64, c_ubyte, POINTER(QueryParam)], c_int),
+
+    # Q value (affects inventory performance)
+    ('GetCoilPRM', [c_int64, POINTER(c_ubyte), POINTER(c_ubyte)], c_int),
+    ('SetCoilPRM', [c_int64, c_ubyte, c_ubyte], c_int),
+
+    # GPIO functions
+    ('GetGpioPara', [c_int64, POINTER(GpioPara)], c_int),
+    ('SetGpioPara', [c_int64, GpioPara], c_int),
+    ('GetGPIOWorkParam', [c_int64, POINTER(GPIOWorkParam)], c_int),
+    ('SetGPIOWorkParam', [c_int64, GPIOWorkParam], c_int),
+
+    # Relay functions
+    ('Release_Relay', [c_int64, c_ubyte], c_int),
+    ('Close_Relay', [c_int64, c_ubyte], c_int),
+
+    # Network functions
+    ('GetNetInfo', [c_int64, POINTER(NetInfo)], c_int),
+    ('SetNetInfo', [c_int64, NetInfo], c_int),
+
+    # WiFi functions
+    ('GetwifiPara', [c_int64, POINTER(WiFiPara)], c_int),
+    ('SetwifiPara', [c_int64, WiFiPara], c_int),
+
+    # Temperature functions
+    ('GetTemperature', [c_int64, POINTER(c_ubyte), POINTER(c_ubyte)], c_int),
+    ('SetTemperature', [c_int64, c_ubyte, c_ubyte], c_int),
+
+    # RFID Type functions
+    ('GetRFIDType', [c_int64, POINTER(c_ubyte)], c_int),
+    ('SetRFIDType', [c_int64, c_ubyte], c_int),
+
+    # Heartbeat functions
+    ('GetHeartbeat', [c_int64, POINTER(Heartbeat)], c_int),
+    ('SetHeartbeat', [c_int64, Heartbeat], c_int),
+
+    # Permission parameters
+    ('GetPermissonPara', [c_int64, POINTER(PermissonPara)], c_int),
+    ('SetPermissonPara', [c_int64, PermissonPara], c_int),
+]
+
+# Loaded and configured library, shared by all CF591Reader instances
+_LIB = None
+_LIB_LOCK = threading.Lock()
+
+
 def _load_library():
     """Load the libCFApi.so shared library"""
-    # First, try loading by name (works if in system library path)
-    # This is the most reliable method when library is properly installed
+    # First, load by name: the dynamic loader resolves it through ld.so.cache
+    # in a single lookup when the library is installed in a system path
     try:
         return ctypes.CDLL('libCFApi.so')
     except OSError:
         pass
     
-    # Then try explicit paths
+    # Then try explicit paths. dlopen() fails fast on a missing file, so there
+    # is no need for a separate os.path.exists() stat before each attempt
+    script_dir = os.path.dirname(os.path.abspath(__file__))
     lib_paths = [
         '/usr/local/lib/libCFApi.so',
         '/usr/lib/libCFApi.so',
         '/usr/lib/aarch64-linux-gnu/libCFApi.so',  # Debian/Ubuntu ARM64 path
         '/usr/lib/arm-linux-gnueabihf/libCFApi.so',  # Debian/Ubuntu ARM path
-    ]
-    
-    # Add relative paths based on script location
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    lib_paths.extend([
         os.path.join(script_dir, 'API/Linux/ARM64/libCFApi.so'),
         os.path.join(script_dir, 'API/Linux/ARM/libCFApi.so'),
         os.path.join(os.getcwd(), 'API/Linux/ARM64/libCFApi.so'),
         os.path.join(os.getcwd(), 'API/Linux/ARM/libCFApi.so'),
-        './API/Linux/ARM64/libCFApi.so',
-        './API/Linux/ARM/libCFApi.so',
-    ])
-    
-    # Try find_library (may return None or partial path)
-    found_lib = ctypes.util.find_library('CFApi')
-    if found_lib:
-        lib_paths.append(found_lib)
+    ]
     
     for lib_path in lib_paths:
-        if lib_path and os.path.exists(lib_path):
-            try:
-                return ctypes.CDLL(lib_path)
-            except OSError as e:
-                # Log the error for debugging but continue trying
-                continue
+        try:
+            return ctypes.CDLL(lib_path)
+        except OSError:
+            continue
     
-    # Final attempt: try with RTLD_GLOBAL flag (sometimes needed)
-    try:
-        return ctypes.CDLL('libCFApi.so', mode=ctypes.RTLD_GLOBAL)
-    except (OSError, AttributeError):
-        pass
+    # Last resort: find_library also looks at LD_LIBRARY_PATH and the
+    # compiler search path, but it runs ldconfig/gcc as subprocesses
+    found_lib = ctypes.util.find_library('CFApi')
+    if found_lib:
+        try:
+            return ctypes.CDLL(found_lib)
+        except OSError:
+            pass
     
     raise OSError(
         "Could not find libCFApi.so. Please install it:\n"
@@ -484,10 +692,37 @@ def _load_library():
     )
 
 
+def _get_library():
+    """Return the shared libCFApi handle, loading it and setting prototypes on first use"""
+    global _LIB
+    if _LIB is None:
+        # Readers may be constructed from several threads at once; configure
+        # the prototypes exactly once and publish the handle only when done
+        with _LIB_LOCK:
+            if _LIB is None:
+                lib = _load_library()
+                for name, argtypes, restype in _PROTOTYPES:
+                    func = getattr(lib, name)
+                    func.argtypes = argtypes
+                    func.restype = restype
+                _LIB = lib
+    return _LIB
+
+
 # ============================================================================
 # Main Reader Class
 # ============================================================================
 
+# GetTagUii timeout (ms) used when draining tags that are already buffered
+_DRAIN_TIMEOUT_MS = 5
+
+
+def _c_string(buf) -> str:
+    """Decode a NUL-terminated char array from a C structure"""
+    # Stop at the first NUL: the bytes after it are not part of the string
+    return bytes(buf).split(b'\x00', 1)[0].decode('utf-8', errors='ignore')
+
+
 class CF591Reader:
     """
     CHAFON CF591 UHF RFID Reader Interface
@@ -500,6 +735,14 @@ class CF591Reader:
     - Antenna management
     - GPIO/Relay control
     
+    Threading: libCFApi is loaded with ctypes.CDLL, which releases the GIL
+    for the duration of every foreign call, so other Python threads keep
+    running while GetTagUii, ReadTag, etc. block on serial I/O. A single
+    reader should still only be driven from one thread at a time (or use
+    start_background_inventory(), which owns the GetTagUii loop). The
+    library keeps its state per handle, so separate CF591Reader instances
+    on different ports can be used from different threads concurrently.
+    
     Example:
         with CF591Reader('/dev/ttyUSB0') as reader:
             # Read single tag (stops after first detection)
@@ -516,9 +759,37 @@ class CF591Reader:
                     print(tag.epc)
             reader.stop_inventory()
     """
+    # Fixed attribute set: slot access on the per-tag path instead of a
+    # __dict__ lookup. Add new instance attributes here.
+    __slots__ = ('_lib', '_port', '_port_bytes', 'baud_rate', '_handle', '_is_open',
+                 '_is_inventory_running', '_inventory_lock',
+                 '_tag_raw', '_tag_buf', '_tag_ref', '_get_tag_uii',
+                 '_resp_buf', '_read_count_buf', '_read_data_buf',
+                 '_write_data_buf', '_pwd_buf', '_mask_buf',
+                 '_params_cache', '_q_cache', '_antenna_cache', '_freq_cache',
+                 '_net_cache', '_info_cache', '_snapshot', '_snapshot_time',
+                 '_suspend_depth', '_suspend_resume',
+                 '_bg_thread', '_bg_stop', '_bg_cond', '_bg_tags', '_bg_error',
+                 '__weakref__')
+    
+    # Shared all-zero access password; the C API only reads it during a call
+    _ZERO_PWD = (c_ubyte * 4)()
+    
+    # set_device_parameters() keyword -> DevicePara field
+    _PARAM_MAP = {
+        'work_mode': 'WORKMODE',
+        'rf_power': 'RFIDPOWER',
+        'antenna_mask': 'ANT',
+        'region': 'REGION',
+        'q_value': 'QVALUE',
+        'session': 'SESSION',
+        'filter_time': 'FILTERTIME',
+        'trigger_time': 'TRIGGLETIME',
+        'buzzer_time': 'BUZZERTIME',
+    }
     
     def __init__(self, port: str = '/dev/ttyUSB0', baud_rate: int = 115200, 
-                 auto_connect: bool = False):
+                 auto_connect: bool = False, thread_safe: bool = True):
         """
         Initialize CF591 Reader
         
@@ -526,191 +797,68 @@ class CF591Reader:
             port: Serial port path (e.g., '/dev/ttyUSB0') or network address
             baud_rate: Baud rate (default: 115200)
             auto_connect: Whether to connect automatically on init
+            thread_safe: Serialize inventory start/stop with a lock. Pass
+                False only if the reader is used from a single thread.
         """
-        self._lib = _load_library()
-        self._setup_functions()
+        self._lib = _get_library()
         
         self.port = port
         self.baud_rate = baud_rate
         self._handle = c_int64(0)  # Initialize to 0, not -1 (library requirement)
         self._is_open = False
         self._is_inventory_running = False
-        self._inventory_lock = threading.Lock()
+        self._inventory_lock = threading.Lock() if thread_safe else contextlib.nullcontext()
+        
+        # Scratch structs reused by every call instead of allocating (and
+        # zeroing) a fresh one per tag/response
+        # The tag buffer is a view over a bytearray so its contents can be
+        # sliced as plain bytes without going through ctypes
+        self._tag_raw = bytearray(ctypes.sizeof(TagInfo))
+        self._tag_buf = TagInfo.from_buffer(self._tag_raw)
+        self._resp_buf = TagResp()
+        # GetReadTagResp output: word count (max 255) and up to 510 bytes
+        self._read_count_buf = c_ubyte()
+        self._read_data_buf = (c_ubyte * 512)()
+        # WriteTag input (up to 255 words) and 4-byte access password
+        self._write_data_buf = (c_ubyte * 512)()
+        self._pwd_buf = (c_ubyte * 4)()
+        # SetSelectMask input (mask_bits is a byte, so at most 255 bits,
+        # which fit in 31 bytes)
+        self._mask_buf = (c_ubyte * 31)()
+        
+        # GetTagUii is called once per tag: bind the function and the
+        # pointer to the tag buffer once instead of looking up/building
+        # them on every call
+        self._get_tag_uii = self._lib.GetTagUii
+        self._tag_ref = byref(self._tag_buf)
+        
+        # Last DevicePara read from / written to the device and other
+        # cached configuration reads (None = unknown, read on next use)
+        self._params_cache = None
+        self._q_cache = None
+        self._antenna_cache = None
+        self._freq_cache = None
+        self._net_cache = None
+        self._info_cache = None
+        self._snapshot = None
+        self._snapshot_time = 0
+        
+        # inventory_suspended() nesting depth and what to resume on exit:
+        # None = nothing, {} = inventory, {'buffer': deque} = background
+        # inventory continuing with its buffered tags
+        self._suspend_depth = 0
+        self._suspend_resume = None
+        
+        # Background inventory (see start_background_inventory)
+        self._bg_thread = None
+        self._bg_stop = threading.Event()
+        self._bg_cond = threading.Condition()
+        self._bg_tags = deque()
+        self._bg_error = None
         
         if auto_connect:
             self.open()
     
-    def _setup_functions(self):
-        """Setup C function signatures"""
-        lib = self._lib
-        
-        # Connection functions
-        lib.OpenDevice.argtypes = [POINTER(c_int64), c_char_p, c_int]
-        lib.OpenDevice.restype = c_int
-        
-        lib.OpenNetConnection.argtypes = [POINTER(c_int64), c_char_p, c_ushort, c_ulong]
-        lib.OpenNetConnection.restype = c_int
-        
-        lib.CloseDevice.argtypes = [c_int64]
-        lib.CloseDevice.restype = c_int
-        
-        # Device info functions
-        lib.GetInfo.argtypes = [c_int64, POINTER(DeviceInfo)]
-        lib.GetInfo.restype = c_int
-        
-        lib.GetDeviceInfo.argtypes = [c_int64, POINTER(DeviceFullInfo)]
-        lib.GetDeviceInfo.restype = c_int
-        
-        lib.GetDevicePara.argtypes = [c_int64, POINTER(DevicePara)]
-        lib.GetDevicePara.restype = c_int
-        
-        lib.SetDevicePara.argtypes = [c_int64, DevicePara]
-        lib.SetDevicePara.restype = c_int
-        
-        lib.RebootDevice.argtypes = [c_int64]
-        lib.RebootDevice.restype = c_int
-        
-        # Inventory functions
-        lib.InventoryContinue.argtypes = [c_int64, c_ubyte, c_ulong]
-        lib.InventoryContinue.restype = c_int
-        
-        lib.GetTagUii.argtypes = [c_int64, POINTER(TagInfo), c_ushort]
-        lib.GetTagUii.restype = c_int
-        
-        lib.InventoryStop.argtypes = [c_int64, c_ushort]
-        lib.InventoryStop.restype = c_int
-        
-        # Power functions
-        lib.GetRFPower.argtypes = [c_int64, POINTER(c_ubyte), POINTER(c_ubyte)]
-        lib.GetRFPower.restype = c_int
-        
-        lib.SetRFPower.argtypes = [c_int64, c_ubyte, c_ubyte]
-        lib.SetRFPower.restype = c_int
-        
-        lib.GetAntPower.argtypes = [c_int64, POINTER(AntPower)]
-        lib.GetAntPower.restype = c_int
-        
-        lib.SetAntPower.argtypes = [c_int64, AntPower]
-        lib.SetAntPower.restype = c_int
-        
-        # Frequency functions
-        lib.GetFreq.argtypes = [c_int64, POINTER(FreqInfo)]
-        lib.GetFreq.restype = c_int
-        
-        lib.SetFreq.argtypes = [c_int64, POINTER(FreqInfo)]
-        lib.SetFreq.restype = c_int
-        
-        # Antenna functions
-        lib.GetAntenna.argtypes = [c_int64, POINTER(c_ubyte)]
-        lib.GetAntenna.restype = c_int
-        
-        lib.SetAntenna.argtypes = [c_int64, POINTER(c_ubyte)]
-        lib.SetAntenna.restype = c_int
-        
-        # Tag operations
-        lib.ReadTag.argtypes = [c_int64, c_ubyte, POINTER(c_ubyte), c_ubyte, c_ushort, c_ubyte]
-        lib.ReadTag.restype = c_int
-        
-        lib.GetReadTagResp.argtypes = [c_int64, POINTER(TagResp), POINTER(c_ubyte), POINTER(c_ubyte), c_ushort]
-        lib.GetReadTagResp.restype = c_int
-        
-        lib.WriteTag.argtypes = [c_int64, c_ubyte, POINTER(c_ubyte), c_ubyte, c_ushort, c_ubyte, POINTER(c_ubyte)]
-        lib.WriteTag.restype = c_int
-        
-        lib.GetTagResp.argtypes = [c_int64, c_ushort, POINTER(TagResp), c_ushort]
-        lib.GetTagResp.restype = c_int
-        
-        lib.LockTag.argtypes = [c_int64, POINTER(c_ubyte), c_ubyte, c_ubyte]
-        lib.LockTag.restype = c_int
-        
-        lib.KillTag.argtypes = [c_int64, POINTER(c_ubyte)]
-        lib.KillTag.restype = c_int
-        
-        # Select/Sort/Query functions
-        lib.SetSelectMask.argtypes = [c_int64, c_ushort, c_ubyte, POINTER(c_ubyte)]
-        lib.SetSelectMask.restype = c_int
-        
-        lib.SelectOrSortGet.argtypes = [c_int64, c_ubyte, POINTER(SelectSortParam)]
-        lib.SelectOrSortGet.restype = c_int
-        
-        lib.SelectOrSortSet.argtypes = [c_int64, c_ubyte, POINTER(SelectSortParam)]
-        lib.SelectOrSortSet.restype = c_int
-        
-        lib.QueryCfgGet.argtypes = [c_int64, c_ubyte, POINTER(QueryParam)]
-        lib.QueryCfgGet.restype = c_int
-        
-        lib.QueryCfgSet.argtypes = [c_int64, c_ubyte, POINTER(QueryParam)]
-        lib.QueryCfgSet.restype = c_int
-        
-        # Q value (affects inventory performance)
-        lib.GetCoilPRM.argtypes = [c_int64, POINTER(c_ubyte), POINTER(c_ubyte)]
-        lib.GetCoilPRM.restype = c_int
-        
-        lib.SetCoilPRM.argtypes = [c_int64, c_ubyte, c_ubyte]
-        lib.SetCoilPRM.restype = c_int
-        
-        # GPIO functions
-        lib.GetGpioPara.argtypes = [c_int64, POINTER(GpioPara)]
-        lib.GetGpioPara.restype = c_int
-        
-        lib.SetGpioPara.argtypes = [c_int64, GpioPara]
-        lib.SetGpioPara.restype = c_int
-        
-        lib.GetGPIOWorkParam.argtypes = [c_int64, POINTER(GPIOWorkParam)]
-        lib.GetGPIOWorkParam.restype = c_int
-        
-        lib.SetGPIOWorkParam.argtypes = [c_int64, GPIOWorkParam]
-        lib.SetGPIOWorkParam.restype = c_int
-        
-        # Relay functions
-        lib.Release_Relay.argtypes = [c_int64, c_ubyte]
-        lib.Release_Relay.restype = c_int
-        
-        lib.Close_Relay.argtypes = [c_int64, c_ubyte]
-        lib.Close_Relay.restype = c_int
-        
-        # Network functions
-        lib.GetNetInfo.argtypes = [c_int64, POINTER(NetInfo)]
-        lib.GetNetInfo.restype = c_int
-        
-        lib.SetNetInfo.argtypes = [c_int64, NetInfo]
-        lib.SetNetInfo.restype = c_int
-        
-        # WiFi functions
-        lib.GetwifiPara.argtypes = [c_int64, POINTER(WiFiPara)]
-        lib.GetwifiPara.restype = c_int
-        
-        lib.SetwifiPara.argtypes = [c_int64, WiFiPara]
-        lib.SetwifiPara.restype = c_int
-        
-        # Temperature functions
-        lib.GetTemperature.argtypes = [c_int64, POINTER(c_ubyte), POINTER(c_ubyte)]
-        lib.GetTemperature.restype = c_int
-        
-        lib.SetTemperature.argtypes = [c_int64, c_ubyte, c_ubyte]
-        lib.SetTemperature.restype = c_int
-        
-        # RFID Type functions
-        lib.GetRFIDType.argtypes = [c_int64, POINTER(c_ubyte)]
-        lib.GetRFIDType.restype = c_int
-        
-        lib.SetRFIDType.argtypes = [c_int64, c_ubyte]
-        lib.SetRFIDType.restype = c_int
-        
-        # Heartbeat functions
-        lib.GetHeartbeat.argtypes = [c_int64, POINTER(Heartbeat)]
-        lib.GetHeartbeat.restype = c_int
-        
-        lib.SetHeartbeat.argtypes = [c_int64, Heartbeat]
-        lib.SetHeartbeat.restype = c_int
-        
-        # Permission parameters
-        lib.GetPermissonPara.argtypes = [c_int64, POINTER(PermissonPara)]
-        lib.GetPermissonPara.restype = c_int
-        
-        lib.SetPermissonPara.argtypes = [c_int64, PermissonPara]
-        lib.SetPermissonPara.restype = c_int
-    
     # ========================================================================
     # Connection Methods
     # ========================================================================
@@ -728,8 +876,7 @@ class CF591Reader:
         if self._is_open:
             return True
         
-        port_bytes = self.port.encode('utf-8')
-        result = self._lib.OpenDevice(byref(self._handle), port_bytes, self.baud_rate)
+        result = self._lib.OpenDevice(byref(self._handle), self._port_bytes, self.baud_rate)
         
         if result != StatusCode.OK:
             raise ConnectionError(
@@ -738,6 +885,7 @@ class CF591Reader:
                 result
             )
         
+        self._invalidate_caches()
         self._is_open = True
         return True
     
@@ -758,12 +906,13 @@ class CF591Reader:
         
         ip_bytes = ip.encode('utf-8')
         result = self._lib.OpenNetConnection(
-            byref(self._handle), ip_bytes, c_ushort(port), c_ulong(timeout_ms)
+            byref(self._handle), ip_bytes, port, timeout_ms
         )
         
         if result != StatusCode.OK:
             raise ConnectionError(f"Failed to connect to {ip}:{port}", result)
         
+        self._invalidate_caches()
         self._is_open = True
         return True
     
@@ -782,6 +931,18 @@ class CF591Reader:
         self._lib.CloseDevice(self._handle)
         self._handle = c_int64(-1)
         self._is_open = False
+        self._invalidate_caches()
+    
+    @property
+    def port(self) -> str:
+        """Serial port path used by open()"""
+        return self._port
+    
+    @port.setter
+    def port(self, value: str):
+        # Encode once here rather than on every (re)connect
+        self._port = value
+        self._port_bytes = value.encode('utf-8')
     
     @property
     def is_open(self) -> bool:
@@ -794,14 +955,14 @@ class CF591Reader:
             raise ConnectionError("Reader is not open. Call open() first.")
     
     def _check_result(self, result: int, error_msg: str, 
-                      ignore_codes: List[int] = None) -> int:
+                      ignore_codes: Optional[FrozenSet[int]] = None) -> int:
         """
         Check API result and convert signed to unsigned
         
         Args:
             result: Result code from API (may be signed)
             error_msg: Error message if result is not OK
-            ignore_codes: List of error codes to ignore (don't raise exception)
+            ignore_codes: Set of error codes to ignore (don't raise exception)
             
         Returns:
             Unsigned result code
@@ -809,7 +970,7 @@ class CF591Reader:
         # Convert signed to unsigned
         unsigned_result = result & 0xFFFFFFFF
         
-        if unsigned_result == StatusCode.OK:
+        if unsigned_result == _OK:
             return unsigned_result
         
         # Check if this is an ignorable error
@@ -823,41 +984,53 @@ class CF591Reader:
     # Device Information Methods
     # ========================================================================
     
-    def get_device_info(self) -> Dict[str, str]:
+    def get_device_info(self, refresh: bool = False) -> Dict[str, str]:
         """
         Get device information (firmware version, hardware version, serial number)
         
+        The information is static, so it is cached per connection.
+        
+        Args:
+            refresh: Re-read the information from the device
+        
         Returns:
             Dictionary with device info
         """
         self._check_open()
         
+        if not refresh and self._info_cache is not None:
+            return dict(self._info_cache)
+        
         dev_info = DeviceInfo()
         result = self._lib.GetInfo(self._handle, byref(dev_info))
         
         if result != StatusCode.OK:
             raise CommandError("Failed to get device info", result)
         
-        return {
-            'firmware_version': bytes(dev_info.firmVersion).rstrip(b'\x00').decode('utf-8', errors='ignore'),
-            'hardware_version': bytes(dev_info.hardVersion).rstrip(b'\x00').decode('utf-8', errors='ignore'),
+        self._info_cache = {
+            'firmware_version': _c_string(dev_info.firmVersion),
+            'hardware_version': _c_string(dev_info.hardVersion),
             'serial_number': bytes(dev_info.SN).hex().upper()
         }
+        return dict(self._info_cache)
     
-    def get_device_parameters(self) -> Dict[str, Any]:
+    def get_device_parameters(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get all device parameters
         
+        The parameters are cached after the first read and kept up to date
+        by this reader's setters; pass refresh=True to re-read the device
+        (e.g. if another program may have changed it).
+        
+        Args:
+            refresh: Re-read the parameters from the device
+        
         Returns:
             Dictionary with all device parameters
         """
         self._check_open()
         
-        params = DevicePara()
-        result = self._lib.GetDevicePara(self._handle, byref(params))
-        
-        if result != StatusCode.OK:
-            raise CommandError("Failed to get device parameters", result)
+        params = self._get_device_para(refresh)
         
         return {
             'device_address': params.DEVICEADDR,
@@ -878,11 +1051,15 @@ class CF591Reader:
             'buzzer_time': params.BUZZERTIME
         }
     
-    def set_device_parameters(self, **kwargs):
+    def set_device_parameters(self, refresh: bool = False, **kwargs):
         """
         Set device parameters
         
+        Unchanged fields are taken from the cached parameters (see
+        get_device_parameters), saving a read round-trip per update.
+        
         Args:
+            refresh: Re-read the current parameters from the device first
             work_mode: Work mode (0=Command, 1=Auto, 2=Trigger)
             rf_power: RF power (0-30 dBm)
             antenna_mask: Antenna mask (bit field)
@@ -895,39 +1072,55 @@ class CF591Reader:
         """
         self._check_open()
         
-        # Get current parameters first
-        params = DevicePara()
-        result = self._lib.GetDevicePara(self._handle, byref(params))
-        if result != StatusCode.OK:
-            raise CommandError("Failed to get current parameters", result)
-        
-        # Update with provided values
-        if 'work_mode' in kwargs:
-            params.WORKMODE = kwargs['work_mode']
-        if 'rf_power' in kwargs:
-            params.RFIDPOWER = kwargs['rf_power']
-        if 'antenna_mask' in kwargs:
-            params.ANT = kwargs['antenna_mask']
-        if 'region' in kwargs:
-            params.REGION = kwargs['region']
-        if 'q_value' in kwargs:
-            params.QVALUE = kwargs['q_value']
-        if 'session' in kwargs:
-            params.SESSION = kwargs['session']
-        if 'filter_time' in kwargs:
-            params.FILTERTIME = kwargs['filter_time']
-        if 'trigger_time' in kwargs:
-            params.TRIGGLETIME = kwargs['trigger_time']
-        if 'buzzer_time' in kwargs:
-            params.BUZZERTIME = kwargs['buzzer_time']
-        
+        # Start from the current parameters
+        params = self._get_device_para(refresh, "Failed to get current parameters")
+        
+        # Update with provided values (unknown keywords are ignored)
+        param_map = self._PARAM_MAP
+        for name, value in kwargs.items():
+            field = param_map.get(name)
+            if field is not None:
+                setattr(params, field, value)
+        
+        self._set_device_para(params, "Failed to set device parameters")
+    
+    def _get_device_para(self, refresh: bool = False,
+                         error_msg: str = "Failed to get device parameters") -> DevicePara:
+        """Return a private copy of the device parameters, read from the device only when not cached"""
+        if refresh or self._params_cache is None:
+            params = DevicePara()
+            result = self._lib.GetDevicePara(self._handle, byref(params))
+            if result != StatusCode.OK:
+                raise CommandError(error_msg, result)
+            self._params_cache = params
+        return DevicePara.from_buffer_copy(self._params_cache)
+    
+    def _set_device_para(self, params: DevicePara, error_msg: str):
+        """Write device parameters and remember them as the cached state"""
+        # Always write, even if the cache matches: the cache may be stale
+        # (e.g. changed by another program) and a skipped write would be lost
+        # Q value, antenna, region, snapshot... may all change with
+        # DevicePara, and the device state is uncertain if the write fails
+        self._invalidate_caches()
         result = self._lib.SetDevicePara(self._handle, params)
         if result != StatusCode.OK:
-            raise CommandError("Failed to set device parameters", result)
+            raise CommandError(error_msg, result)
+        self._params_cache = params
+    
+    def _invalidate_caches(self):
+        """Forget all cached configuration (reconnect, reboot, any setter)"""
+        self._params_cache = None
+        self._q_cache = None
+        self._antenna_cache = None
+        self._freq_cache = None
+        self._net_cache = None
+        self._info_cache = None
+        self._snapshot = None
     
     def reboot(self):
         """Reboot the device"""
         self._check_open()
+        self._invalidate_caches()
         result = self._lib.RebootDevice(self._handle)
         if result != StatusCode.OK:
             raise CommandError("Failed to reboot device", result)
@@ -947,10 +1140,7 @@ class CF591Reader:
         """
         self._check_open()
         
-        params = DevicePara()
-        result = self._lib.GetDevicePara(self._handle, byref(params))
-        if result != StatusCode.OK:
-            raise CommandError("Failed to get buzzer settings", result)
+        params = self._get_device_para(error_msg="Failed to get buzzer settings")
         
         buzzer_time = params.BUZZERTIME
         return {
@@ -979,10 +1169,7 @@ class CF591Reader:
             raise ValueError("Duration must be between 0 and 255")
         
         # Get current parameters
-        params = DevicePara()
-        result = self._lib.GetDevicePara(self._handle, byref(params))
-        if result != StatusCode.OK:
-            raise CommandError("Failed to get current parameters", result)
+        params = self._get_device_para(error_msg="Failed to get current parameters")
         
         # Set buzzer time (0 = disabled, >0 = enabled with duration)
         if enabled:
@@ -990,9 +1177,7 @@ class CF591Reader:
         else:
             params.BUZZERTIME = 0
         
-        result = self._lib.SetDevicePara(self._handle, params)
-        if result != StatusCode.OK:
-            raise CommandError("Failed to set buzzer settings", result)
+        self._set_device_para(params, "Failed to set buzzer settings")
     
     def enable_buzzer(self, duration: int = 5):
         """
@@ -1058,7 +1243,8 @@ class CF591Reader:
         if not 0 <= power <= 30:
             raise ValueError("Power must be between 0 and 30 dBm")
         
-        result = self._lib.SetRFPower(self._handle, c_ubyte(power), c_ubyte(0))
+        self._invalidate_caches()  # DevicePara mirrors this setting
+        result = self._lib.SetRFPower(self._handle, power, 0)
         
         if result != StatusCode.OK:
             raise CommandError("Failed to set RF power", result)
@@ -1098,6 +1284,7 @@ class CF591Reader:
         for i, power in enumerate(power_values[:8]):
             ant_power.AntPower[i] = power
         
+        self._invalidate_caches()  # May change RFIDPOWER in DevicePara
         result = self._lib.SetAntPower(self._handle, ant_power)
         
         if result != StatusCode.OK:
@@ -1107,27 +1294,32 @@ class CF591Reader:
     # Inventory (Tag Reading) Methods
     # ========================================================================
     
-    def start_inventory(self, inv_count: int = 0, inv_param: int = 0):
+    def start_inventory(self, inv_count: int = 0, inv_param: int = 0,
+                        background: bool = False, buffer_size: int = 4096):
         """
         Start continuous inventory (tag reading)
         
         Args:
             inv_count: Number of tags to read (0 = continuous)
             inv_param: Inventory parameters (0 = default)
+            background: Also start a thread that drains tags into a buffer
+                (see start_background_inventory)
+            buffer_size: Maximum buffered tags when background=True
         """
         self._check_open()
+        self._stop_background_thread()
         
         with self._inventory_lock:
             # If already running, stop first
             if self._is_inventory_running:
                 try:
-                    self._lib.InventoryStop(self._handle, c_ushort(1000))
+                    self._lib.InventoryStop(self._handle, 1000)
                 except:
                     pass
                 self._is_inventory_running = False
             
             result = self._lib.InventoryContinue(
-                self._handle, c_ubyte(inv_count), c_ulong(inv_param)
+                self._handle, inv_count, inv_param
             )
             
             # Convert signed error code to unsigned for comparison
@@ -1137,6 +1329,14 @@ class CF591Reader:
                 raise CommandError("Failed to start inventory", result)
             
             self._is_inventory_running = True
+            
+            if background:
+                # Under the lock, so a concurrent stop_inventory() either
+                # sees the new thread or has finished before it exists
+                replaced = self._start_background_thread(buffer_size)
+        
+        if background and replaced is not None:
+            replaced.join()
     
     def stop_inventory(self, timeout: int = 5000):
         """
@@ -1147,12 +1347,19 @@ class CF591Reader:
         """
         self._check_open()
         
+        # Fast path: read_single_tag/read_tags/close call this even when
+        # nothing is running. The check is repeated under the lock below.
+        if not self._is_inventory_running:
+            return
+        
+        self._stop_background_thread()
+        
         with self._inventory_lock:
             if not self._is_inventory_running:
                 # Already stopped, nothing to do
                 return
             
-            result = self._lib.InventoryStop(self._handle, c_ushort(timeout))
+            result = self._lib.InventoryStop(self._handle, timeout)
             
             # Convert signed error code to unsigned for comparison
             unsigned_result = result & 0xFFFFFFFF
@@ -1167,6 +1374,150 @@ class CF591Reader:
             
             self._is_inventory_running = False
     
+    def start_background_inventory(self, buffer_size: int = 4096,
+                                   inv_count: int = 0, inv_param: int = 0):
+        """
+        Start inventory and read tags on a background thread
+        
+        A daemon thread calls GetTagUii in a loop (the GIL is released while
+        it blocks) and buffers the tags, so serial I/O overlaps with the
+        caller's processing. While it runs, get_tag(), read_tags_iterator()
+        and read_tags_iterator_raw() take tags from the buffer. Stop it with
+        stop_background_inventory() or stop_inventory().
+        
+        Args:
+            buffer_size: Maximum buffered tags; the oldest are dropped
+                when the consumer falls behind
+            inv_count: Number of tags to read (0 = continuous)
+            inv_param: Inventory parameters (0 = default)
+        """
+        self.start_inventory(inv_count, inv_param,
+                             background=True, buffer_size=buffer_size)
+    
+    def stop_background_inventory(self, timeout: int = 5000):
+        """
+        Stop background inventory started by start_background_inventory()
+        
+        Args:
+            timeout: Timeout in milliseconds for stopping the inventory
+        """
+        self.stop_inventory(timeout)
+    
+    def _start_background_thread(self, buffer_size: int,
+                                 tags: Optional[deque] = None) -> Optional[threading.Thread]:
+        """
+        Spawn the thread that moves tags from the reader into _bg_tags
+        
+        `tags` continues an existing buffer instead of starting an empty
+        one. Call with _inventory_lock held. Returns a thread started meanwhile
+        by a concurrent start_inventory() (already told to stop), which the
+        caller must join after releasing the lock.
+        """
+        replaced = self._bg_thread
+        if replaced is not None:
+            self._bg_stop.set()
+        
+        # Each thread gets its own stop event, so a thread that is still
+        # winding down is not revived by the next start
+        self._bg_tags = tags if tags is not None else deque(maxlen=buffer_size)
+        self._bg_error = None
+        self._bg_stop = threading.Event()
+        self._bg_thread = threading.Thread(
+            target=self._background_loop, args=(self._bg_stop,),
+            name='CF591-inventory', daemon=True
+        )
+        self._bg_thread.start()
+        return replaced
+    
+    def _background_loop(self, stop: threading.Event):
+        """Background thread body: move tags from the reader into _bg_tags"""
+        try:
+            while not stop.is_set():
+                tag_info = self._get_tag_info(200)
+                if tag_info is None:
+                    continue
+                tag = Tag.from_tag_info(tag_info)
+                with self._bg_cond:
+                    self._bg_tags.append(tag)
+                    self._bg_cond.notify()
+        except Exception as e:
+            # Any failure ends the thread: hand it to the consumers, which
+            # would otherwise wait for tags that never come
+            with self._bg_cond:
+                self._bg_error = e
+                self._bg_cond.notify_all()
+    
+    def _stop_background_thread(self):
+        """Signal the background reader (if any) to exit and wait for it"""
+        # Detach the thread under the lock so concurrent start/stop calls
+        # never join the wrong thread or lose track of one; join outside it
+        with self._inventory_lock:
+            thread = self._bg_thread
+            if thread is None:
+                return
+            self._bg_thread = None
+            self._bg_stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+    
+    def _pop_background_tag(self, timeout: int) -> Optional[Tag]:
+        """Take the next buffered tag, waiting up to timeout milliseconds"""
+        with self._bg_cond:
+            if not self._bg_tags and self._bg_error is None:
+                self._bg_cond.wait(timeout / 1000.0)
+            if self._bg_tags:
+                return self._bg_tags.popleft()
+            if self._bg_error is not None:
+                raise self._bg_error
+            return None
+    
+    @contextlib.contextmanager
+    def inventory_suspended(self):
+        """
+        Context manager that pauses inventory for the duration of the block
+        
+        Inventory (including background inventory) is stopped on entry and
+        restarted on exit if it was running. Nested uses only stop and
+        restart once, so several memory operations can share one pause.
+        Tags buffered by background inventory are kept and can still be
+        read after the block.
+        
+        Example:
+            with reader.inventory_suspended():
+                tid = reader.read_tag_memory(MemoryBank.TID, 0, 6, epc=epc)
+                user = reader.read_tag_memory(MemoryBank.USER, 0, 4, epc=epc)
+        """
+        self._suspend_depth += 1
+        if self._suspend_depth == 1:
+            if self._bg_thread is not None:
+                self._suspend_resume = {'buffer': self._bg_tags}
+            elif self._is_inventory_running:
+                self._suspend_resume = {}
+            else:
+                self._suspend_resume = None
+            if self._suspend_resume is not None:
+                try:
+                    self.stop_inventory(timeout=1000)
+                except:
+                    pass
+        try:
+            yield
+        finally:
+            self._suspend_depth -= 1
+            if self._suspend_depth == 0 and self._suspend_resume is not None:
+                buffered = self._suspend_resume.get('buffer')
+                self._suspend_resume = None
+                try:
+                    self.start_inventory()
+                    if buffered is not None:
+                        with self._inventory_lock:
+                            replaced = self._start_background_thread(
+                                buffered.maxlen, buffered)
+                        if replaced is not None:
+                            replaced.join()
+                except:
+                    pass
+    
     def get_tag(self, timeout: int = 1000) -> Optional[Tag]:
         """
         Get a single tag from the inventory buffer
@@ -1177,17 +1528,76 @@ class CF591Reader:
         Returns:
             Tag object if a tag was read, None otherwise
         """
+        if self._bg_thread is not None:
+            return self._pop_background_tag(timeout)
+        
+        tag_info = self._get_tag_info(timeout)
+        if tag_info is None:
+            return None
+        return Tag.from_tag_info(tag_info)
+    
+    def get_tag_epc(self, timeout: int = 1000) -> Optional[bytes]:
+        """
+        Get only the EPC of the next tag from the inventory buffer
+        
+        Cheaper than get_tag() for callers that only count or look up
+        tags: no Tag object, hex strings or RSSI conversion are built.
+        
+        Args:
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            Raw EPC bytes if a tag was read, None otherwise
+        """
+        if self._bg_thread is not None:
+            tag = self._pop_background_tag(timeout)
+            return None if tag is None else tag.epc_bytes
+        
+        if self._get_tag_info(timeout) is None:
+            return None
+        raw = self._tag_raw
+        return bytes(raw[_TAG_CODE_OFFSET:_TAG_CODE_OFFSET + raw[_TAG_LEN_OFFSET]])
+    
+    def get_tags(self, max_count: int = 64, timeout: int = 1000) -> List[Tag]:
+        """
+        Get a batch of tags from the inventory buffer
+        
+        Waits up to `timeout` for the first tag, then drains whatever else
+        is already buffered (short per-read timeout) up to max_count.
+        
+        Args:
+            max_count: Maximum number of tags to return
+            timeout: Timeout for the first tag in milliseconds
+            
+        Returns:
+            List of Tag objects (empty if none arrived within timeout)
+        """
+        tags = []
+        tag = self.get_tag(timeout)
+        while tag is not None:
+            tags.append(tag)
+            if len(tags) >= max_count:
+                break
+            tag = self.get_tag(_DRAIN_TIMEOUT_MS)
+        return tags
+    
+    def _get_tag_info(self, timeout: int) -> Optional[TagInfo]:
+        """
+        Fetch the next tag from the inventory buffer as a raw TagInfo
+        
+        The returned struct is the reader's shared scratch buffer: convert
+        it before the next call.
+        """
         self._check_open()
         
-        tag_info = TagInfo()
-        result = self._lib.GetTagUii(self._handle, byref(tag_info), c_ushort(timeout))
+        result = self._get_tag_uii(self._handle, self._tag_ref, timeout)
         
         # Convert signed error code to unsigned for comparison
         unsigned_result = result & 0xFFFFFFFF
         
-        if unsigned_result == StatusCode.OK:
-            return Tag.from_tag_info(tag_info)
-        elif unsigned_result in (StatusCode.CMD_INVENTORY_STOP, StatusCode.CMD_COMM_TIMEOUT):
+        if unsigned_result == _OK:
+            return self._tag_buf
+        elif unsigned_result in _NO_TAG_CODES:
             return None
         else:
             raise CommandError("Failed to get tag", result)
@@ -1210,16 +1620,18 @@ class CF591Reader:
         try:
             self.start_inventory()
             
-            start_time = time.time()
-            timeout_sec = timeout / 1000.0
+            # Monotonic integer deadline: immune to wall-clock jumps
+            deadline = time.monotonic_ns() + timeout * 1_000_000
             
-            while (time.time() - start_time) < timeout_sec:
-                tag = self.get_tag(timeout=min(500, timeout))
+            # GetTagUii blocks natively for up to the timeout it is given, so
+            # hand it everything that is left instead of polling with sleeps
+            while True:
+                remaining_ms = (deadline - time.monotonic_ns()) // 1_000_000
+                if remaining_ms <= 0:
+                    return None
+                tag = self.get_tag(timeout=min(remaining_ms, 0xFFFF))
                 if tag:
                     return tag
-                time.sleep(0.01)  # Small delay to prevent busy waiting
-            
-            return None
             
         finally:
             try:
@@ -1228,7 +1640,7 @@ class CF591Reader:
                 pass
     
     def read_tags(self, max_tags: Optional[int] = None, timeout: int = 1000,
-                  max_timeouts: int = 3) -> List[Tag]:
+                  max_timeouts: int = 3, unique: bool = False) -> List[Tag]:
         """
         Read multiple tags
         
@@ -1236,27 +1648,53 @@ class CF591Reader:
             max_tags: Maximum number of tags to read (None = read until timeout)
             timeout: Timeout per read in milliseconds
             max_timeouts: Number of consecutive timeouts before stopping
+            unique: Return each EPC only once (first read wins); max_tags
+                then counts distinct tags
             
         Returns:
             List of Tag objects
         """
+        return list(self.iter_tags(max_tags, timeout, max_timeouts, unique))
+    
+    def iter_tags(self, max_tags: Optional[int] = None, timeout: int = 1000,
+                  max_timeouts: int = 3,
+                  unique: bool = False) -> Generator[Tag, None, None]:
+        """
+        Generator version of read_tags(): yields each tag as soon as it is read
+        
+        Starts inventory on the first iteration and stops it when the
+        generator finishes or is closed (e.g. on break out of a for loop).
+        Arguments are the same as for read_tags().
+        
+        Yields:
+            Tag objects as they are detected
+        """
         self._check_open()
         
-        tags = []
+        seen = set()  # Raw EPC bytes already returned (unique=True)
+        remaining = max_tags or sys.maxsize  # None/0 = no limit
         consecutive_timeouts = 0
         
         try:
             self.start_inventory()
             
-            while True:
-                if max_tags and len(tags) >= max_tags:
-                    break
+            while remaining:
+                tag_info = self._get_tag_info(timeout)
                 
-                tag = self.get_tag(timeout=timeout)
-                
-                if tag:
-                    tags.append(tag)
+                if tag_info is not None:
                     consecutive_timeouts = 0
+                    if unique:
+                        # Compare raw bytes so duplicates are dropped before
+                        # any Tag/hex conversion is done for them
+                        raw = self._tag_raw
+                        epc_raw = bytes(raw[_TAG_CODE_OFFSET:
+                                            _TAG_CODE_OFFSET + raw[_TAG_LEN_OFFSET]])
+                        if epc_raw in seen:
+                            continue
+                        seen.add(epc_raw)
+                    # Convert before yielding: tag_info is the shared buffer
+                    remaining -= 1
+                    yield Tag.from_tag_info(tag_info)
                 else:
                     consecutive_timeouts += 1
                     if consecutive_timeouts >= max_timeouts:
@@ -1267,8 +1705,6 @@ class CF591Reader:
                 self.stop_inventory()
             except:
                 pass
-        
-        return tags
     
     def read_tags_iterator(self, max_count: Optional[int] = None, 
                            timeout: int = 1000) -> Generator[Tag, None, None]:
@@ -1288,21 +1724,86 @@ class CF591Reader:
                 print(f"Found: {tag.epc}")
             reader.stop_inventory()
         """
+        if self._bg_thread is not None:
+            yield from self._iter_polled(self._pop_background_tag, max_count, timeout)
+            return
+        
+        for tag_info in self._iter_tag_infos(max_count, timeout):
+            yield Tag.from_tag_info(tag_info)
+    
+    def read_tags_iterator_raw(self, max_count: Optional[int] = None,
+                               timeout: int = 1000) -> Generator[Dict[str, Any], None, None]:
+        """
+        Like read_tags_iterator(), but yields plain dicts (same keys as
+        Tag.to_dict()) built directly from the C structure
+        
+        Use this for high-rate streaming where the Tag object is not needed.
+        
+        Args:
+            max_count: Maximum number of tags to yield (None = unlimited)
+            timeout: Timeout per read in milliseconds
+            
+        Yields:
+            Tag dictionaries as they are detected
+        """
+        if self._bg_thread is not None:
+            for tag in self._iter_polled(self._pop_background_tag, max_count, timeout):
+                yield tag.to_dict()
+            return
+        
+        for tag_info in self._iter_tag_infos(max_count, timeout):
+            yield Tag.dict_from_tag_info(tag_info)
+    
+    def read_tag_batch(self, max_tags: int = 256,
+                       timeout: int = 1000) -> TagBatch:
+        """
+        Collect tags from a running inventory into a column-wise TagBatch
+        
+        Stops after max_tags tags or 3 consecutive timeouts, like
+        read_tags_iterator().
+        
+        Args:
+            max_tags: Maximum number of tags to collect
+            timeout: Timeout per read in milliseconds
+            
+        Returns:
+            TagBatch holding the tags read
+            
+        Example:
+            reader.start_inventory()
+            batch = reader.read_tag_batch(max_tags=500)
+            reader.stop_inventory()
+            print(len(batch), sum(batch.rssi) / max(len(batch), 1))
+        """
+        batch = TagBatch()
+        for tag_info in self._iter_tag_infos(max_tags, timeout):
+            batch.append_tag_info(tag_info)
+        return batch
+    
+    def _iter_tag_infos(self, max_count: Optional[int],
+                        timeout: int) -> Generator[TagInfo, None, None]:
+        """Yield raw TagInfo structures until max_count or 3 timeouts in a row"""
+        if self._bg_thread is not None:
+            raise RuntimeError("Raw tag reads are not available while background "
+                               "inventory is running; use get_tag() or "
+                               "read_tags_iterator()")
+        return self._iter_polled(self._get_tag_info, max_count, timeout)
+    
+    def _iter_polled(self, fetch: Callable[[int], Any], max_count: Optional[int],
+                     timeout: int) -> Generator[Any, None, None]:
+        """Call fetch(timeout) until max_count results or 3 timeouts in a row"""
         self._check_open()
         
-        count = 0
+        remaining = max_count or sys.maxsize  # None/0 = no limit
         consecutive_timeouts = 0
         max_consecutive_timeouts = 3
         
-        while True:
-            if max_count and count >= max_count:
-                break
-            
-            tag = self.get_tag(timeout=timeout)
+        while remaining:
+            item = fetch(timeout)
             
-            if tag:
-                yield tag
-                count += 1
+            if item is not None:
+                yield item
+                remaining -= 1
                 consecutive_timeouts = 0
             else:
                 consecutive_timeouts += 1
@@ -1332,88 +1833,72 @@ class CF591Reader:
         """
         self._check_open()
         
-        # Stop inventory if running (memory operations require inventory to be stopped)
-        was_running = self._is_inventory_running
-        if was_running:
-            try:
-                self.stop_inventory(timeout=1000)
-            except:
-                pass
-        
-        # Store original filter state
-        original_mask_set = False
-        
-        try:
-            # If EPC is provided, set select mask to target this specific tag
-            if epc:
-                # EPC in TagInfo starts at bit 32 (after CRC and PC)
-                mask_ptr = 32
-                mask_bits = len(epc) * 8
-                try:
-                    self.set_select_mask(mask_ptr, mask_bits, epc)
-                    original_mask_set = True
-                    # Small delay to ensure mask is set
-                    import time
-                    time.sleep(0.15)
-                except:
-                    pass  # Continue even if mask setting fails
-            
-            # Prepare password
-            if password:
-                pwd = (c_ubyte * 4)(*password)
-            else:
-                pwd = (c_ubyte * 4)(0, 0, 0, 0)
-            
-            # Option: 0x01 = match tag first (use select mask), 0x00 = skip match
-            # Always use 0x01 when we have EPC to ensure tag is matched
-            option = c_ubyte(0x01 if epc else 0x00)
-            
-            result = self._lib.ReadTag(
-                self._handle, option, pwd, c_ubyte(memory_bank),
-                c_ushort(word_ptr), c_ubyte(word_count)
-            )
-            
-            unsigned_result = result & 0xFFFFFFFF
-            if unsigned_result != StatusCode.OK:
-                raise TagError("Failed to initiate read command", result)
-            
-            # Get response
-            resp = TagResp()
-            read_count = c_ubyte()
-            read_data = (c_ubyte * 256)()
-            
-            result = self._lib.GetReadTagResp(
-                self._handle, byref(resp), byref(read_count),
-                read_data, c_ushort(timeout)
-            )
-            
-            unsigned_result = result & 0xFFFFFFFF
-            if unsigned_result != StatusCode.OK:
-                # Provide more helpful error message
-                if unsigned_result == StatusCode.CMD_COMM_TIMEOUT:
-                    raise TagError(
-                        "Failed to read tag memory: Communication timeout. "
-                        "Ensure the tag is still in range and supports memory reading.", 
-                        result
-                    )
-                else:
-                    raise TagError("Failed to read tag memory", result)
-            
-            return bytes(read_data[:read_count.value * 2])
-        finally:
-            # Clear select mask if we set it
-            if original_mask_set:
-                try:
-                    self.clear_filter()
-                except:
-                    pass
+        # Memory operations require inventory to be stopped
+        with self.inventory_suspended():
+            # Store original filter state
+            original_mask_set = False
             
-            # Restart inventory if it was running
-            if was_running:
-                try:
-                    self.start_inventory()
-                except:
-                    pass
+            try:
+                # If EPC is provided, set select mask to target this specific tag
+                if epc:
+                    # EPC in TagInfo starts at bit 32 (after CRC and PC)
+                    mask_ptr = 32
+                    mask_bits = len(epc) * 8
+                    try:
+                        self.set_select_mask(mask_ptr, mask_bits, epc)
+                        original_mask_set = True
+                        # Small delay to ensure mask is set
+                        import time
+                        time.sleep(0.15)
+                    except:
+                        pass  # Continue even if mask setting fails
+                
+                # Prepare password
+                pwd = self._password_buffer(password)
+                
+                # Option: 0x01 = match tag first (use select mask), 0x00 = skip match
+                # Always use 0x01 when we have EPC to ensure tag is matched
+                option = 0x01 if epc else 0x00
+                
+                result = self._lib.ReadTag(
+                    self._handle, option, pwd, memory_bank,
+                    word_ptr, word_count
+                )
+                
+                unsigned_result = result & 0xFFFFFFFF
+                if unsigned_result != StatusCode.OK:
+                    raise TagError("Failed to initiate read command", result)
+                
+                # Get response
+                resp = self._resp_buf
+                read_count = self._read_count_buf
+                read_data = self._read_data_buf
+                
+                result = self._lib.GetReadTagResp(
+                    self._handle, byref(resp), byref(read_count),
+                    read_data, timeout
+                )
+                
+                unsigned_result = result & 0xFFFFFFFF
+                if unsigned_result != StatusCode.OK:
+                    # Provide more helpful error message
+                    if unsigned_result == StatusCode.CMD_COMM_TIMEOUT:
+                        raise TagError(
+                            "Failed to read tag memory: Communication timeout. "
+                            "Ensure the tag is still in range and supports memory reading.", 
+                            result
+                        )
+                    else:
+                        raise TagError("Failed to read tag memory", result)
+                
+                return bytes(memoryview(read_data)[:read_count.value * 2])
+            finally:
+                # Clear select mask if we set it
+                if original_mask_set:
+                    try:
+                        self.clear_filter()
+                    except:
+                        pass
     
     def write_tag_memory(self, memory_bank: MemoryBank, word_ptr: int,
                          data: bytes, password: bytes = None,
@@ -1431,82 +1916,82 @@ class CF591Reader:
         """
         self._check_open()
         
+        # Accept any bytes-like/iterable of ints; memmove needs real bytes
+        data = bytes(data)
         if len(data) % 2 != 0:
             raise ValueError("Data length must be even (word-aligned)")
         
         word_count = len(data) // 2
+        if word_count > 255:
+            raise ValueError("Data length must be at most 510 bytes (255 words)")
         
-        # Stop inventory if running (memory operations require inventory to be stopped)
-        was_running = self._is_inventory_running
-        if was_running:
-            try:
-                self.stop_inventory(timeout=1000)
-            except:
-                pass
-        
-        # Store original filter state
-        original_mask_set = False
-        
-        try:
-            # If EPC is provided, set select mask to target this specific tag
-            if epc:
-                # EPC in TagInfo starts at bit 32 (after CRC and PC)
-                mask_ptr = 32
-                mask_bits = len(epc) * 8
-                try:
-                    self.set_select_mask(mask_ptr, mask_bits, epc)
-                    original_mask_set = True
-                    # Small delay to ensure mask is set
-                    import time
-                    time.sleep(0.1)
-                except:
-                    pass  # Continue even if mask setting fails
+        # Memory operations require inventory to be stopped
+        with self.inventory_suspended():
+            # Store original filter state
+            original_mask_set = False
             
-            # Prepare password
-            if password:
-                pwd = (c_ubyte * 4)(*password)
-            else:
-                pwd = (c_ubyte * 4)(0, 0, 0, 0)
-            
-            # Prepare data
-            write_data = (c_ubyte * len(data))(*data)
-            
-            # Option: 0x01 = match tag first, 0x00 = skip match
-            # Use 0x01 if we have an EPC to match, otherwise 0x00
-            option = c_ubyte(0x01 if epc else 0x00)
-            
-            result = self._lib.WriteTag(
-                self._handle, option, pwd, c_ubyte(memory_bank),
-                c_ushort(word_ptr), c_ubyte(word_count), write_data
-            )
-            
-            unsigned_result = result & 0xFFFFFFFF
-            if unsigned_result != StatusCode.OK:
-                raise TagError("Failed to initiate write command", result)
-            
-            # Get response
-            resp = TagResp()
-            result = self._lib.GetTagResp(
-                self._handle, c_ushort(0x0004), byref(resp), c_ushort(timeout)
-            )
-            
-            unsigned_result = result & 0xFFFFFFFF
-            if unsigned_result != StatusCode.OK:
-                raise TagError("Failed to write tag memory", result)
-        finally:
-            # Clear select mask if we set it
-            if original_mask_set:
-                try:
-                    self.clear_filter()
-                except:
-                    pass
-            
-            # Restart inventory if it was running
-            if was_running:
-                try:
-                    self.start_inventory()
-                except:
-                    pass
+            try:
+                # If EPC is provided, set select mask to target this specific tag
+                if epc:
+                    # EPC in TagInfo starts at bit 32 (after CRC and PC)
+                    mask_ptr = 32
+                    mask_bits = len(epc) * 8
+                    try:
+                        self.set_select_mask(mask_ptr, mask_bits, epc)
+                        original_mask_set = True
+                        # Small delay to ensure mask is set
+                        import time
+                        time.sleep(0.1)
+                    except:
+                        pass  # Continue even if mask setting fails
+                
+                # Prepare password
+                pwd = self._password_buffer(password)
+                
+                # Prepare data
+                write_data = self._write_data_buf
+                ctypes.memmove(write_data, data, len(data))
+                
+                # Option: 0x01 = match tag first, 0x00 = skip match
+                # Use 0x01 if we have an EPC to match, otherwise 0x00
+                option = 0x01 if epc else 0x00
+                
+                result = self._lib.WriteTag(
+                    self._handle, option, pwd, memory_bank,
+                    word_ptr, word_count, write_data
+                )
+                
+                unsigned_result = result & 0xFFFFFFFF
+                if unsigned_result != StatusCode.OK:
+                    raise TagError("Failed to initiate write command", result)
+                
+                # Get response
+                resp = self._resp_buf
+                result = self._lib.GetTagResp(
+                    self._handle, 0x0004, byref(resp), timeout
+                )
+                
+                unsigned_result = result & 0xFFFFFFFF
+                if unsigned_result != StatusCode.OK:
+                    raise TagError("Failed to write tag memory", result)
+            finally:
+                # Clear select mask if we set it
+                if original_mask_set:
+                    try:
+                        self.clear_filter()
+                    except:
+                        pass
+    
+    def _password_buffer(self, password: Optional[bytes]):
+        """Copy an access password into the scratch buffer (shared zeros if None)"""
+        if not password:
+            return self._ZERO_PWD
+        if len(password) > 4:
+            raise ValueError("Password must be at most 4 bytes")
+        pwd = self._pwd_buf
+        ctypes.memset(pwd, 0, 4)
+        ctypes.memmove(pwd, bytes(password), len(password))
+        return pwd
     
     def write_tag_epc(self, new_epc: bytes, password: bytes = None):
         """
@@ -1530,12 +2015,8 @@ class CF591Reader:
         """
         self._check_open()
         
-        if password:
-            pwd = (c_ubyte * 4)(*password)
-        else:
-            pwd = (c_ubyte * 4)(0, 0, 0, 0)
-        
-        result = self._lib.LockTag(self._handle, pwd, c_ubyte(area), c_ubyte(action))
+        pwd = self._password_buffer(password)
+        result = self._lib.LockTag(self._handle, pwd, area, action)
         
         if result != StatusCode.OK:
             raise TagError("Failed to lock tag", result)
@@ -1556,7 +2037,7 @@ class CF591Reader:
         if len(kill_password) != 4:
             raise ValueError("Kill password must be exactly 4 bytes")
         
-        pwd = (c_ubyte * 4)(*kill_password)
+        pwd = self._password_buffer(kill_password)
         result = self._lib.KillTag(self._handle, pwd)
         
         if result != StatusCode.OK:
@@ -1571,15 +2052,26 @@ class CF591Reader:
         Set tag selection mask for filtering
         
         Args:
-            mask_ptr: Pointer position in bits
-            mask_bits: Number of bits in the mask
-            mask: Mask data bytes
+            mask_ptr: Pointer position in bits (0-65535)
+            mask_bits: Number of bits in the mask (0-255, at most len(mask) * 8)
+            mask: Mask data bytes (at most 31)
         """
         self._check_open()
         
-        mask_data = (c_ubyte * len(mask))(*mask)
+        # The C arguments are a ushort and a byte: check the ranges here, as
+        # ctypes would silently truncate (256 bits would become 0 = match all)
+        mask = bytes(mask)
+        mask_data = self._mask_buf
+        if len(mask) > len(mask_data):
+            raise ValueError(f"Mask must be at most {len(mask_data)} bytes")
+        if not 0 <= mask_ptr <= 0xFFFF:
+            raise ValueError("Mask pointer must be between 0 and 65535")
+        if not 0 <= mask_bits <= min(255, len(mask) * 8):
+            raise ValueError("Mask bits must be between 0 and 255 and "
+                             "covered by the mask data")
+        ctypes.memmove(mask_data, mask, len(mask))
         result = self._lib.SetSelectMask(
-            self._handle, c_ushort(mask_ptr), c_ubyte(mask_bits), mask_data
+            self._handle, mask_ptr, mask_bits, mask_data
         )
         
         if result != StatusCode.OK:
@@ -1589,13 +2081,17 @@ class CF591Reader:
         """
         Set filter to only read tags with specific EPC prefix
         
+        The filter is a Gen2 Select mask applied by the reader over the air
+        (EPC bank, bit pointer 32, after CRC and PC), so non-matching tags
+        stay silent: prefer it to reading everything and comparing
+        tag.epc in Python, which costs airtime and a Tag per unwanted read.
+        Remove it again with clear_filter().
+        
         Args:
             epc_prefix: EPC prefix bytes to match
         """
         # EPC starts at bit 32 (after CRC and PC)
-        mask_ptr = 32
-        mask_bits = len(epc_prefix) * 8
-        self.set_select_mask(mask_ptr, mask_bits, epc_prefix)
+        self.set_select_mask(32, len(epc_prefix) * 8, epc_prefix)
     
     def clear_filter(self):
         """Clear any tag filters"""
@@ -1605,10 +2101,18 @@ class CF591Reader:
     # Q Value Methods (Affects Inventory Performance)
     # ========================================================================
     
-    def get_q_value(self) -> int:
+    def get_q_value(self, refresh: bool = False, force: bool = False) -> int:
         """
         Get Q value for inventory algorithm
         
+        The value is cached until set_q_value()/set_device_parameters()
+        changes it.
+        
+        Args:
+            refresh: Re-read the value from the device
+            force: If reading the device parameters fails, fall back to
+                   GetCoilPRM (only while inventory is stopped)
+        
         Returns:
             Q value (0-15)
             
@@ -1618,41 +2122,32 @@ class CF591Reader:
         """
         self._check_open()
         
-        # Try to get from device parameters first (more reliable)
+        if not refresh and self._q_cache is not None:
+            return self._q_cache
+        
+        self._q_cache = self._read_q_value(refresh, force)
+        return self._q_cache
+    
+    def _read_q_value(self, refresh: bool, force: bool) -> int:
+        """Read the Q value from the device (see get_q_value)"""
+        # Device parameters carry the Q value and can be read at any time
         try:
-            params = self.get_device_parameters()
+            params = self.get_device_parameters(refresh)
             return params.get('q_value', 4)  # Default to 4 if not available
-        except:
-            pass
-        
-        # Fallback to direct API call
-        # Stop inventory if running (some operations require inventory to be stopped)
-        was_running = self._is_inventory_running
-        if was_running:
-            try:
-                self.stop_inventory(timeout=1000)
-            except:
-                pass
+        except CommandError:
+            # Only a device error may take the GetCoilPRM path below, only
+            # when the caller asked for it, and never during inventory:
+            # stopping and restarting it would drop in-flight tag reads
+            if not force or self._is_inventory_running:
+                raise
+        
+        q_val = c_ubyte()
+        reserved = c_ubyte()
+        result = self._lib.GetCoilPRM(self._handle, byref(q_val), byref(reserved))
         
-        try:
-            q_val = c_ubyte()
-            reserved = c_ubyte()
-            result = self._lib.GetCoilPRM(self._handle, byref(q_val), byref(reserved))
-            
-            unsigned_result = result & 0xFFFFFFFF
-            if unsigned_result == StatusCode.OK:
-                return q_val.value
-            else:
-                # If API call fails, return from device parameters or default
-                params = self.get_device_parameters()
-                return params.get('q_value', 4)
-        finally:
-            # Restart inventory if it was running
-            if was_running:
-                try:
-                    self.start_inventory()
-                except:
-                    pass
+        if result != StatusCode.OK:
+            raise CommandError("Failed to get Q value", result)
+        return q_val.value
     
     def set_q_value(self, q_value: int):
         """
@@ -1668,37 +2163,47 @@ class CF591Reader:
         if not 0 <= q_value <= 15:
             raise ValueError("Q value must be between 0 and 15")
         
-        result = self._lib.SetCoilPRM(self._handle, c_ubyte(q_value), c_ubyte(0))
+        self._invalidate_caches()  # DevicePara mirrors this setting
+        result = self._lib.SetCoilPRM(self._handle, q_value, 0)
         
         if result != StatusCode.OK:
             raise CommandError("Failed to set Q value", result)
+        
+        self._q_cache = q_value
     
     # ========================================================================
     # Frequency Methods
     # ========================================================================
     
-    def get_frequency(self) -> Dict[str, Any]:
+    def get_frequency(self, refresh: bool = False) -> Dict[str, Any]:
         """
-        Get frequency settings
+        Get frequency settings (cached until changed through this reader)
+        
+        Args:
+            refresh: Re-read the settings from the device
         
         Returns:
             Dictionary with frequency information
         """
         self._check_open()
         
+        if not refresh and self._freq_cache is not None:
+            return dict(self._freq_cache)
+        
         freq_info = FreqInfo()
         result = self._lib.GetFreq(self._handle, byref(freq_info))
         
         if result != StatusCode.OK:
             raise CommandError("Failed to get frequency info", result)
         
-        return {
+        self._freq_cache = {
             'region': freq_info.region,
             'start_freq': freq_info.StartFreq,
             'stop_freq': freq_info.StopFreq,
             'step_freq': freq_info.StepFreq,
             'channel_count': freq_info.cnt
         }
+        return dict(self._freq_cache)
     
     def set_frequency(self, region: Region, start_freq: int = None, 
                       stop_freq: int = None, step_freq: int = None):
@@ -1723,6 +2228,7 @@ class CF591Reader:
         if step_freq is not None:
             freq_info.StepFreq = step_freq
         
+        self._invalidate_caches()  # DevicePara mirrors this setting
         result = self._lib.SetFreq(self._handle, byref(freq_info))
         
         if result != StatusCode.OK:
@@ -1732,21 +2238,29 @@ class CF591Reader:
     # Antenna Methods
     # ========================================================================
     
-    def get_antenna(self) -> int:
+    def get_antenna(self, refresh: bool = False) -> int:
         """
-        Get current antenna configuration
+        Get current antenna configuration (cached until changed through
+        this reader)
+        
+        Args:
+            refresh: Re-read the configuration from the device
         
         Returns:
             Antenna mask (bit field: bit 0 = ant 1, bit 1 = ant 2, etc.)
         """
         self._check_open()
         
+        if not refresh and self._antenna_cache is not None:
+            return self._antenna_cache
+        
         antenna = c_ubyte()
         result = self._lib.GetAntenna(self._handle, byref(antenna))
         
         if result != StatusCode.OK:
             raise CommandError("Failed to get antenna config", result)
         
+        self._antenna_cache = antenna.value
         return antenna.value
     
     def set_antenna(self, antenna_mask: int):
@@ -1759,10 +2273,13 @@ class CF591Reader:
         self._check_open()
         
         antenna = c_ubyte(antenna_mask)
+        self._invalidate_caches()  # DevicePara mirrors this setting
         result = self._lib.SetAntenna(self._handle, byref(antenna))
         
         if result != StatusCode.OK:
             raise CommandError("Failed to set antenna", result)
+        
+        self._antenna_cache = antenna_mask
     
     # ========================================================================
     # GPIO / Relay Methods
@@ -1797,7 +2314,7 @@ class CF591Reader:
         """
         self._check_open()
         
-        result = self._lib.Close_Relay(self._handle, c_ubyte(time_100ms))
+        result = self._lib.Close_Relay(self._handle, time_100ms)
         
         if result != StatusCode.OK:
             raise CommandError("Failed to activate relay", result)
@@ -1811,7 +2328,7 @@ class CF591Reader:
         """
         self._check_open()
         
-        result = self._lib.Release_Relay(self._handle, c_ubyte(time_100ms))
+        result = self._lib.Release_Relay(self._handle, time_100ms)
         
         if result != StatusCode.OK:
             raise CommandError("Failed to deactivate relay", result)
@@ -1850,7 +2367,8 @@ class CF591Reader:
         """
         self._check_open()
         
-        result = self._lib.SetTemperature(self._handle, c_ubyte(limit), c_ubyte(0))
+        self._invalidate_caches()  # Shown in get_snapshot()
+        result = self._lib.SetTemperature(self._handle, limit, 0)
         
         if result != StatusCode.OK:
             raise CommandError("Failed to set temperature limit", result)
@@ -1859,29 +2377,34 @@ class CF591Reader:
     # Network Methods
     # ========================================================================
     
-    def get_network_info(self) -> Dict[str, str]:
-        """Get network configuration"""
+    def get_network_info(self, refresh: bool = False) -> Dict[str, str]:
+        """
+        Get network configuration (cached per connection)
+        
+        Args:
+            refresh: Re-read the configuration from the device
+        """
         self._check_open()
         
+        if not refresh and self._net_cache is not None:
+            return dict(self._net_cache)
+        
         net_info = NetInfo()
         result = self._lib.GetNetInfo(self._handle, byref(net_info))
         
         if result != StatusCode.OK:
             raise CommandError("Failed to get network info", result)
         
-        ip = '.'.join(str(b) for b in net_info.IP)
-        mac = ':'.join(f'{b:02X}' for b in net_info.MAC)
-        port = (net_info.PORT[0] << 8) | net_info.PORT[1]
-        netmask = '.'.join(str(b) for b in net_info.NetMask)
-        gateway = '.'.join(str(b) for b in net_info.Gateway)
+        ip, mac, port, netmask, gateway = _NET_INFO.unpack_from(net_info)
         
-        return {
-            'ip': ip,
-            'mac': mac,
+        self._net_cache = {
+            'ip': socket.inet_ntoa(ip),
+            'mac': '%02X:%02X:%02X:%02X:%02X:%02X' % tuple(mac),
             'port': port,
-            'netmask': netmask,
-            'gateway': gateway
+            'netmask': socket.inet_ntoa(netmask),
+            'gateway': socket.inet_ntoa(gateway)
         }
+        return dict(self._net_cache)
     
     # ========================================================================
     # WiFi Methods
@@ -1897,13 +2420,65 @@ class CF591Reader:
         if result != StatusCode.OK:
             raise CommandError("Failed to get WiFi params", result)
         
+        enabled, ssid, _, ip, port = _WIFI_PARA.unpack_from(wifi)
+        
         return {
-            'enabled': bool(wifi.wifiEn),
-            'ssid': bytes(wifi.SSID).rstrip(b'\x00').decode('utf-8', errors='ignore'),
-            'ip': '.'.join(str(b) for b in wifi.IP),
-            'port': (wifi.PORT[0] << 8) | wifi.PORT[1]
+            'enabled': bool(enabled),
+            'ssid': _c_string(ssid),
+            'ip': socket.inet_ntoa(ip),
+            'port': port
         }
     
+    # ========================================================================
+    # Status Snapshot
+    # ========================================================================
+    
+    def get_snapshot(self, max_age: float = 0.25) -> Dict[str, Any]:
+        """
+        Get GPIO, network, WiFi, frequency, antenna and temperature status
+        in one call
+        
+        Meant for dashboards that poll everything periodically: the result
+        is reused for `max_age` seconds, and frequency/antenna/network come
+        from the per-setting caches, so a refresh costs only the calls whose
+        values are not cached. A section the reader does not support is
+        returned as None instead of failing the whole snapshot.
+        
+        Args:
+            max_age: Maximum age in seconds of a previously taken snapshot
+                that may be returned (0 = always take a new one)
+        
+        Returns:
+            Dictionary with keys 'gpio', 'network', 'wifi', 'frequency',
+            'antenna' and 'temperature'
+        """
+        self._check_open()
+        
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._snapshot_time <= max_age:
+            return self._copy_snapshot()
+        
+        snapshot = {}
+        for key, getter in (('gpio', self.get_gpio_params),
+                            ('network', self.get_network_info),
+                            ('wifi', self.get_wifi_params),
+                            ('frequency', self.get_frequency),
+                            ('antenna', self.get_antenna),
+                            ('temperature', self.get_temperature)):
+            try:
+                snapshot[key] = getter()
+            except CommandError:
+                snapshot[key] = None
+        
+        self._snapshot = snapshot
+        self._snapshot_time = now
+        return self._copy_snapshot()
+    
+    def _copy_snapshot(self) -> Dict[str, Any]:
+        """Copy the cached snapshot, section dicts included, for a caller"""
+        return {key: dict(value) if isinstance(value, dict) else value
+                for key, value in self._snapshot.items()}
+    
     # ========================================================================
     # Context Manager Support
     # ========================================================================
@@ -1940,19 +2515,30 @@ def scan_for_readers(ports: List[str] = None) -> List[str]:
         # Auto-detect serial ports
         ports = glob.glob('/dev/ttyUSB*') + glob.glob('/dev/ttyACM*')
     
-    available = []
+    if not ports:
+        return []
+    
+    # Probe all ports at once so the open/handshake timeouts of dead ports
+    # overlap instead of adding up (ctypes releases the GIL while blocked)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(16, len(ports))) as executor:
+        results = executor.map(_probe_reader, ports)
     
-    for port in ports:
+    return [port for port, ok in zip(ports, results) if ok]
+
+
+def _probe_reader(port: str) -> bool:
+    """Return True if a reader on `port` opens and answers GetInfo"""
+    try:
+        reader = CF591Reader(port)
+        reader.open()
         try:
-            reader = CF591Reader(port)
-            reader.open()
             reader.get_device_info()  # Verify communication
+        finally:
             reader.close()
-            available.append(port)
-        except:
-            pass
-    
-    return available
+        return True
+    except:
+        return False
 
 
 # ============================================================================
@@ -2018,10 +2604,19 @@ if __name__ == '__main__':
                 reader.start_inventory()
                 
                 tag_count = 0
+                batch_size = 1
                 try:
                     while True:
-                        tag = reader.get_tag(timeout=1000)
-                        if tag:
+                        tags = reader.get_tags(max_count=batch_size, timeout=1000)
+                        
+                        # Grow the batch while reads come back full, shrink
+                        # it when they come back empty
+                        if len(tags) == batch_size:
+                            batch_size = min(batch_size * 2, 64)
+                        elif not tags:
+                            batch_size = max(batch_size // 2, 1)
+                        
+                        for tag in tags:
                             tag_count += 1
                             print(f"\nTag #{tag_count}:")
                             print(f"  EPC:     {tag.epc}")
@@ -6,11 +6,11 @@ This file demonstrates various use cases for the CF591 RFID reader.
 Run with: python3 examples.py
 """
 
+import io
 import time
 import sys
-from chafon_cf591 import (
-    CF591Reader, Tag, MemoryBank, LockAction, LockArea, Region, WorkMode
-)
+from collections import OrderedDict
+from chafon_cf591 import CF591Reader, MemoryBank
 
 
 def example_basic_reading():
@@ -28,8 +28,8 @@ def example_basic_reading():
         
         reader.start_inventory()
         
-        start_time = time.time()
-        while (time.time() - start_time) < 5:
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
             tag = reader.get_tag(timeout=500)
             if tag:
                 print(f"  Tag EPC: {tag.epc} | RSSI: {tag.rssi:.1f} dBm")
@@ -115,12 +115,14 @@ def example_multiple_tags():
     with CF591Reader('/dev/ttyUSB0') as reader:
         print("Reading all tags in range...")
         
-        # Read up to 100 tags or until timeout
-        tags = reader.read_tags(max_tags=100, timeout=1000, max_timeouts=3)
+        # Read up to 100 tags or until timeout, printing each as it arrives
+        # instead of waiting for the whole list
+        count = 0
+        for count, tag in enumerate(
+                reader.iter_tags(max_tags=100, timeout=1000, max_timeouts=3), 1):
+            print(f"  {count}. EPC: {tag.epc}")
         
-        print(f"\nFound {len(tags)} tag(s):")
-        for i, tag in enumerate(tags, 1):
-            print(f"  {i}. EPC: {tag.epc}")
+        print(f"\nFound {count} tag(s)")
         
         # Using iterator (more memory efficient for many tags)
         print("\nUsing iterator approach:")
@@ -146,8 +148,10 @@ def example_continuous_with_callback():
     
     def process_tag(tag):
         """Process each tag - your logic goes here"""
-        if tag.epc not in seen_tags:
-            seen_tags.add(tag.epc)
+        # Key on the raw EPC bytes; the hex string is only needed for display
+        key = tag.epc_bytes
+        if key not in seen_tags:
+            seen_tags.add(key)
             print(f"  NEW tag: {tag.epc}")
             # Your logic here: database insert, API call, etc.
             return True
@@ -159,13 +163,15 @@ def example_continuous_with_callback():
         
         reader.start_inventory()
         
-        start_time = time.time()
+        deadline = time.monotonic() + 5
         new_count = 0
         
-        while (time.time() - start_time) < 5:
-            tag = reader.get_tag(timeout=500)
-            if tag and process_tag(tag):
-                new_count += 1
+        while time.monotonic() < deadline:
+            # Wait for the next tag, then also take whatever is already
+            # buffered behind it
+            for tag in reader.get_tags(max_count=32, timeout=500):
+                if process_tag(tag):
+                    new_count += 1
         
         reader.stop_inventory()
         print(f"\nTotal unique tags found: {len(seen_tags)}")
@@ -181,32 +187,37 @@ def example_device_configuration():
     print("Example 6: Device Configuration")
     print("=" * 60)
     
-    with CF591Reader('/dev/ttyUSB0') as reader:
-        # Get device info
-        info = reader.get_device_info()
-        print("Device Information:")
-        print(f"  Firmware: {info['firmware_version']}")
-        print(f"  Hardware: {info['hardware_version']}")
-        print(f"  Serial:   {info['serial_number']}")
-        
-        # Get device parameters
-        params = reader.get_device_parameters()
-        print("\nDevice Parameters:")
-        print(f"  RF Power:     {params['rf_power']} dBm")
-        print(f"  Region:       {params['region']}")
-        print(f"  Q Value:      {params['q_value']}")
-        print(f"  Work Mode:    {params['work_mode']}")
-        print(f"  Antenna Mask: {params['antenna_mask']:04b}")
-        print(f"  Filter Time:  {params['filter_time']}")
-        
-        # Get frequency info
-        freq = reader.get_frequency()
-        print("\nFrequency Settings:")
-        print(f"  Region:       {freq['region']}")
-        print(f"  Start Freq:   {freq['start_freq'] / 100:.2f} MHz")
-        print(f"  Stop Freq:    {freq['stop_freq'] / 100:.2f} MHz")
-        print(f"  Step:         {freq['step_freq'] / 100:.2f} MHz")
-        print(f"  Channels:     {freq['channel_count']}")
+    # Collect the report and write it in one go
+    out = io.StringIO()
+    try:
+        with CF591Reader('/dev/ttyUSB0') as reader:
+            # Get device info
+            info = reader.get_device_info()
+            print("Device Information:", file=out)
+            print(f"  Firmware: {info['firmware_version']}", file=out)
+            print(f"  Hardware: {info['hardware_version']}", file=out)
+            print(f"  Serial:   {info['serial_number']}", file=out)
+            
+            # Get device parameters
+            params = reader.get_device_parameters()
+            print("\nDevice Parameters:", file=out)
+            print(f"  RF Power:     {params['rf_power']} dBm", file=out)
+            print(f"  Region:       {params['region']}", file=out)
+            print(f"  Q Value:      {params['q_value']}", file=out)
+            print(f"  Work Mode:    {params['work_mode']}", file=out)
+            print(f"  Antenna Mask: {params['antenna_mask']:04b}", file=out)
+            print(f"  Filter Time:  {params['filter_time']}", file=out)
+            
+            # Get frequency info
+            freq = reader.get_frequency()
+            print("\nFrequency Settings:", file=out)
+            print(f"  Region:       {freq['region']}", file=out)
+            print(f"  Start Freq:   {freq['start_freq'] / 100:.2f} MHz", file=out)
+            print(f"  Stop Freq:    {freq['stop_freq'] / 100:.2f} MHz", file=out)
+            print(f"  Step:         {freq['step_freq'] / 100:.2f} MHz", file=out)
+            print(f"  Channels:     {freq['channel_count']}", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
 
 
 def example_tag_memory_operations():
@@ -334,15 +345,21 @@ def example_rssi_based_proximity():
         
         reader.start_inventory()
         
-        start_time = time.time()
-        while (time.time() - start_time) < 5:
-            tag = reader.get_tag(timeout=200)
-            if tag:
+        # Visual bars for every level (0-20), built once
+        bars = ['█' * n + '░' * (20 - n) for n in range(21)]
+        
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            # Take every tag that is already buffered and print them with
+            # one write instead of one print per tag
+            lines = []
+            for tag in reader.get_tags(timeout=200):
                 proximity = get_proximity(tag.rssi)
-                # Create a visual bar
-                bar_len = int((tag.rssi + 80) / 2)  # Scale to 0-20
-                bar = '█' * max(0, bar_len) + '░' * max(0, 20 - bar_len)
-                print(f"  {bar} RSSI: {tag.rssi:6.1f} dBm | {proximity}")
+                bar_len = min(max(int((tag.rssi + 80) / 2), 0), 20)  # Scale to 0-20
+                lines.append(f"  {bars[bar_len]} RSSI: {tag.rssi:6.1f} dBm | {proximity}\n")
+            if lines:
+                sys.stdout.write(''.join(lines))
+                sys.stdout.flush()
         
         reader.stop_inventory()
 
@@ -370,9 +387,9 @@ def example_q_value_optimization():
             # Small delay to ensure Q value is set
             time.sleep(0.2)
             
-            start = time.time()
+            start = time.monotonic()
             tags = reader.read_tags(max_tags=50, timeout=500, max_timeouts=2)
-            elapsed = time.time() - start
+            elapsed = time.monotonic() - start
             
             print(f"\n  Q={q}: Found {len(tags)} tags in {elapsed:.2f}s")
             
@@ -401,6 +418,14 @@ def example_access_control_simulation():
         'E20034120118000000000002': 'Bob',
         'E20034120118000000000003': 'Charlie',
     }
+    # Look tags up by raw EPC bytes so no hex string is built per attempt
+    authorized = {bytes.fromhex(epc): name for epc, name in AUTHORIZED_TAGS.items()}
+    
+    # Repeat reads of a tag still in the field are ignored for 1 second.
+    # Entries are kept oldest-first so expired ones can be dropped from the
+    # front, keeping the table as small as the set of recently seen tags.
+    DEBOUNCE_NS = 1_000_000_000
+    last_seen = OrderedDict()  # EPC bytes -> time.monotonic_ns()
     
     with CF591Reader('/dev/ttyUSB0') as reader:
         # Use lower power for close-range access control
@@ -409,21 +434,28 @@ def example_access_control_simulation():
         print("Access Control System Active")
         print("Present your tag (10 seconds)...\n")
         
-        start_time = time.time()
-        while (time.time() - start_time) < 10:
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
             tag = reader.read_single_tag(timeout=1000)
             
             if tag:
-                epc = tag.epc
-                if epc in AUTHORIZED_TAGS:
-                    user = AUTHORIZED_TAGS[epc]
+                now = time.monotonic_ns()
+                epc = tag.epc_bytes
+                last = last_seen.get(epc)
+                if last is not None and now - last < DEBOUNCE_NS:
+                    continue  # Same tag, same presentation
+                last_seen[epc] = now
+                last_seen.move_to_end(epc)
+                while now - next(iter(last_seen.values())) >= DEBOUNCE_NS:
+                    last_seen.popitem(last=False)
+                
+                user = authorized.get(epc)
+                if user is not None:
                     print(f"  ✓ ACCESS GRANTED: Welcome, {user}!")
                     # In real use: activate relay, open door, etc.
                     # reader.activate_relay(time_100ms=10)
                 else:
-                    print(f"  ✗ ACCESS DENIED: Unknown tag {epc}")
-                
-                time.sleep(1)  # Debounce
+                    print(f"  ✗ ACCESS DENIED: Unknown tag {tag.epc}")
         
         print("\nAccess control demo complete")
 
@@ -438,13 +470,35 @@ def example_temperature_monitoring():
     print("Example 12: Temperature Monitoring")
     print("=" * 60)
     
-    with CF591Reader('/dev/ttyUSB0') as reader:
-        temp = reader.get_temperature()
-        print(f"Reader Temperature: {temp['current']}°C")
-        print(f"Temperature Limit:  {temp['limit']}°C")
-        
-        if temp['current'] > temp['limit'] - 10:
-            print("\n⚠️ WARNING: Temperature is approaching limit!")
+    # Collect the report and write it in one go
+    out = io.StringIO()
+    try:
+        with CF591Reader('/dev/ttyUSB0') as reader:
+            temp = reader.get_temperature()
+            print(f"Reader Temperature: {temp['current']}°C", file=out)
+            print(f"Temperature Limit:  {temp['limit']}°C", file=out)
+            
+            if temp['current'] > temp['limit'] - 10:
+                print("\n⚠️ WARNING: Temperature is approaching limit!", file=out)
+    finally:
+        sys.stdout.write(out.getvalue())
+
+
+# Example number -> function, shared by the menu and the command line
+_EXAMPLES = {
+    '1': example_basic_reading,
+    '2': example_trigger_based_reading,
+    '3': example_range_control,
+    '4': example_multiple_tags,
+    '5': example_continuous_with_callback,
+    '6': example_device_configuration,
+    '7': example_tag_memory_operations,
+    '8': example_tag_filtering,
+    '9': example_rssi_based_proximity,
+    '10': example_q_value_optimization,
+    '11': example_access_control_simulation,
+    '12': example_temperature_monitoring,
+}
 
 
 def run_interactive_demo():
@@ -475,21 +529,6 @@ Available Examples:
   q.  Quit
 """)
     
-    examples = {
-        '1': example_basic_reading,
-        '2': example_trigger_based_reading,
-        '3': example_range_control,
-        '4': example_multiple_tags,
-        '5': example_continuous_with_callback,
-        '6': example_device_configuration,
-        '7': example_tag_memory_operations,
-        '8': example_tag_filtering,
-        '9': example_rssi_based_proximity,
-        '10': example_q_value_optimization,
-        '11': example_access_control_simulation,
-        '12': example_temperature_monitoring,
-    }
-    
     while True:
         choice = input("\nSelect example (1-12, 0=all, q=quit): ").strip().lower()
         
@@ -497,15 +536,15 @@ Available Examples:
             print("Goodbye!")
             break
         elif choice == '0':
-            for func in examples.values():
+            for func in _EXAMPLES.values():
                 try:
                     func()
                 except Exception as e:
                     print(f"Error: {e}")
                 input("\nPress Enter for next example...")
-        elif choice in examples:
+        elif choice in _EXAMPLES:
             try:
-                examples[choice]()
+                _EXAMPLES[choice]()
             except Exception as e:
                 print(f"Error: {e}")
         else:
@@ -516,23 +555,9 @@ if __name__ == '__main__':
     if len(sys.argv) > 1:
         # Run specific example by number
         example_num = sys.argv[1]
-        examples = {
-            '1': example_basic_reading,
-            '2': example_trigger_based_reading,
-            '3': example_range_control,
-            '4': example_multiple_tags,
-            '5': example_continuous_with_callback,
-            '6': example_device_configuration,
-            '7': example_tag_memory_operations,
-            '8': example_tag_filtering,
-            '9': example_rssi_based_proximity,
-            '10': example_q_value_optimization,
-            '11': example_access_control_simulation,
-            '12': example_temperature_monitoring,
-        }
-        if example_num in examples:
+        if example_num in _EXAMPLES:
             try:
-                examples[example_num]()
+                _EXAMPLES[example_num]()
             except Exception as e:
                 print(f"Error: {e}")
                 sys.exit(1)
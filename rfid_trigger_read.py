@@ -86,32 +86,40 @@ def find_rfid_device():
     
     return None
 
-def enable_buzzer_safe(reader, max_retries=3, delay=0.3):
-    """Enable buzzer with retry logic and proper delays"""
+def _retry(operation, max_retries, delay, backoff=1.0, report=False):
+    """
+    Call operation() until it stops raising CF591Error, at most max_retries times.
+    
+    Waits delay * backoff**retry seconds before each retry. With report=True
+    every retry is announced and the last error is re-raised; otherwise a
+    final failure is reported by returning False.
+    """
     for retry in range(max_retries):
         try:
             if retry > 0:
-                time.sleep(delay)
-            reader.enable_buzzer(duration=BUZZER_DURATION)
+                time.sleep(delay * (backoff ** retry))
+            operation()
             return True
         except CF591Error:
             if retry < max_retries - 1:
+                if report:
+                    print(f"  Retry {retry + 1}/{max_retries}...", end="", flush=True)
                 continue
+            if report:
+                # Last retry failed, re-raise the exception
+                raise
     return False
 
 
+def enable_buzzer_safe(reader, max_retries=3, delay=0.3):
+    """Enable buzzer with retry logic and proper delays"""
+    return _retry(lambda: reader.enable_buzzer(duration=BUZZER_DURATION),
+                  max_retries, delay)
+
+
 def disable_buzzer_safe(reader, max_retries=3, delay=0.1):
     """Disable buzzer with retry logic"""
-    for retry in range(max_retries):
-        try:
-            if retry > 0:
-                time.sleep(delay)
-            reader.disable_buzzer()
-            return True
-        except CF591Error:
-            if retry < max_retries - 1:
-                continue
-    return False
+    return _retry(reader.disable_buzzer, max_retries, delay)
 
 
 def set_rf_power_safe(reader, power, max_retries=3, initial_delay=0.3):
@@ -119,24 +127,11 @@ def set_rf_power_safe(reader, power, max_retries=3, initial_delay=0.3):
     Set RF power with retry logic to handle intermittent communication errors.
     
     The device may need time to initialize after connection, or may experience
-    temporary communication issues. This function retries with increasing delays.
+    temporary communication issues. This function retries with increasing delays
+    (exponential backoff: 0.3s, 0.5s, 0.8s).
     """
-    for retry in range(max_retries):
-        try:
-            if retry > 0:
-                # Exponential backoff: 0.3s, 0.5s, 0.8s
-                delay = initial_delay * (1.5 ** retry)
-                time.sleep(delay)
-            reader.set_rf_power(power)
-            return True
-        except CF591Error as e:
-            if retry < max_retries - 1:
-                print(f"  Retry {retry + 1}/{max_retries}...", end="", flush=True)
-                continue
-            else:
-                # Last retry failed, re-raise the exception
-                raise
-    return False
+    return _retry(lambda: reader.set_rf_power(power),
+                  max_retries, initial_delay, backoff=1.5, report=True)
 
 
 def start_inventory_safe(reader, max_retries=5, initial_delay=0.2):
@@ -144,34 +139,22 @@ def start_inventory_safe(reader, max_retries=5, initial_delay=0.2):
     Start inventory with retry logic to handle intermittent communication errors.
     
     The device may need time to initialize or may experience temporary communication
-    issues. This function retries with increasing delays.
+    issues. This function retries with increasing delays (exponential backoff:
+    0.2s, 0.3s, 0.45s, 0.68s, 1.0s).
     """
-    for retry in range(max_retries):
+    def start():
+        # Ensure inventory is stopped before starting
         try:
-            if retry > 0:
-                # Exponential backoff: 0.2s, 0.3s, 0.45s, 0.68s, 1.0s
-                delay = initial_delay * (1.5 ** retry)
-                time.sleep(delay)
-            
-            # Ensure inventory is stopped before starting
-            try:
-                reader.stop_inventory()
-                time.sleep(0.05)
-            except:
-                pass
-            
-            reader.start_inventory()
-            # Small delay to ensure inventory is started
+            reader.stop_inventory()
             time.sleep(0.05)
-            return True
-        except CF591Error as e:
-            if retry < max_retries - 1:
-                print(f"  Retry {retry + 1}/{max_retries}...", end="", flush=True)
-                continue
-            else:
-                # Last retry failed, re-raise the exception
-                raise
-    return False
+        except:
+            pass
+        
+        reader.start_inventory()
+        # Small delay to ensure inventory is started
+        time.sleep(0.05)
+    
+    return _retry(start, max_retries, initial_delay, backoff=1.5, report=True)
 
 
 # ============================================================================
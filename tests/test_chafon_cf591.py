@@ -0,0 +1,265 @@
+"""
+Tests for chafon_cf591 that run without the reader or libCFApi
+
+A small fake stands in for the C library; it records calls and keeps
+DevicePara in memory like the device does.
+"""
+
+import collections
+import ctypes
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chafon_cf591
+from chafon_cf591 import CF591Reader, DevicePara, FreqInfo, Region, StatusCode
+
+
+class FakeLib:
+    """Python stand-in for the libCFApi functions used by the tests"""
+    
+    def __init__(self):
+        self.calls = []
+        self.para = DevicePara()
+        self.freq = FreqInfo()
+        self.temperature_limit = 80
+        self.tags = collections.deque()  # EPCs GetTagUii will report
+    
+    def _record(self, name, *args):
+        self.calls.append((name,) + args)
+        return 0
+    
+    def __getattr__(self, name):
+        # Any function without a dedicated fake just succeeds
+        return lambda *args: self._record(name, *args)
+    
+    def GetDevicePara(self, handle, ref):
+        ctypes.memmove(ctypes.addressof(ref._obj), bytes(self.para),
+                       ctypes.sizeof(DevicePara))
+        return self._record('GetDevicePara')
+    
+    def SetDevicePara(self, handle, params):
+        self.para = DevicePara.from_buffer_copy(params)
+        return self._record('SetDevicePara')
+    
+    def GetTagUii(self, handle, ref, timeout):
+        if not self.tags:
+            time.sleep(min(timeout, 5) / 1000.0)
+            return int(StatusCode.CMD_COMM_TIMEOUT)
+        epc = self.tags.popleft()
+        tag_info = ref._obj
+        tag_info.codeLen = len(epc)
+        ctypes.memmove(tag_info.code, epc, len(epc))
+        return 0
+    
+    def SetRFPower(self, handle, power, reserved):
+        self.para.RFIDPOWER = power
+        return self._record('SetRFPower')
+    
+    def SetAntPower(self, handle, ant_power):
+        self.para.RFIDPOWER = ant_power.AntPower[0]
+        return self._record('SetAntPower')
+    
+    def SetCoilPRM(self, handle, q_value, reserved):
+        self.para.QVALUE = q_value
+        return self._record('SetCoilPRM')
+    
+    def GetAntenna(self, handle, ref):
+        ref._obj.value = self.para.ANT
+        return self._record('GetAntenna')
+    
+    def SetAntenna(self, handle, ref):
+        self.para.ANT = ref._obj.value
+        return self._record('SetAntenna')
+    
+    def GetFreq(self, handle, ref):
+        ctypes.memmove(ctypes.addressof(ref._obj), bytes(self.freq),
+                       ctypes.sizeof(FreqInfo))
+        return self._record('GetFreq')
+    
+    def SetFreq(self, handle, ref):
+        self.freq = FreqInfo.from_buffer_copy(ref._obj)
+        self.para.REGION = self.freq.region
+        return self._record('SetFreq')
+    
+    def GetTemperature(self, handle, current, limit):
+        current._obj.value = 40
+        limit._obj.value = self.temperature_limit
+        return self._record('GetTemperature')
+    
+    def SetTemperature(self, handle, limit, reserved):
+        self.temperature_limit = limit
+        return self._record('SetTemperature')
+    
+    def SetSelectMask(self, handle, mask_ptr, mask_bits, mask):
+        return self._record('SetSelectMask', mask_ptr, mask_bits,
+                            bytes(mask)[:(mask_bits + 7) // 8])
+
+
+class ReaderTestCase(unittest.TestCase):
+    """Base class: an open CF591Reader backed by a fresh FakeLib"""
+    
+    def setUp(self):
+        self.lib = FakeLib()
+        self._saved_lib = chafon_cf591._LIB
+        chafon_cf591._LIB = self.lib
+        self.reader = CF591Reader('/dev/null')
+        self.reader.open()
+    
+    def tearDown(self):
+        self.reader.close()
+        chafon_cf591._LIB = self._saved_lib
+    
+    def calls(self, name):
+        return [call for call in self.lib.calls if call[0] == name]
+
+
+class SelectMaskTest(ReaderTestCase):
+    
+    def test_epc_prefix(self):
+        self.reader.filter_by_epc_prefix(b'\xE2\x00')
+        self.assertEqual(self.calls('SetSelectMask'),
+                         [('SetSelectMask', 32, 16, b'\xE2\x00')])
+    
+    def test_longest_mask(self):
+        self.reader.set_select_mask(0, 248, b'\xAA' * 31)
+        self.assertEqual(self.calls('SetSelectMask')[0][2], 248)
+    
+    def test_32_byte_mask_is_rejected(self):
+        # 256 bits does not fit the byte-sized argument and would be
+        # truncated to 0 (select everything)
+        with self.assertRaises(ValueError):
+            self.reader.set_select_mask(32, 256, b'\xAA' * 32)
+        with self.assertRaises(ValueError):
+            self.reader.filter_by_epc_prefix(b'\xAA' * 32)
+        self.assertEqual(self.calls('SetSelectMask'), [])
+    
+    def test_mask_bits_range(self):
+        for mask_bits in (-1, 256, 17):
+            with self.assertRaises(ValueError):
+                self.reader.set_select_mask(32, mask_bits, b'\xAA\xBB')
+        with self.assertRaises(ValueError):
+            self.reader.set_select_mask(0x10000, 8, b'\xAA')
+        self.assertEqual(self.calls('SetSelectMask'), [])
+
+
+class DeviceParaTest(ReaderTestCase):
+    
+    def test_unchanged_write_still_reaches_device(self):
+        self.reader.set_device_parameters(rf_power=20)
+        # Another program changes the device behind the cached copy
+        self.lib.para.RFIDPOWER = 10
+        self.reader.set_device_parameters(rf_power=20)
+        self.assertEqual(len(self.calls('SetDevicePara')), 2)
+        self.assertEqual(self.lib.para.RFIDPOWER, 20)
+    
+    def test_parameters_are_read_once(self):
+        self.reader.set_device_parameters(rf_power=20)
+        self.reader.set_device_parameters(q_value=5)
+        self.reader.get_device_parameters()
+        self.assertEqual(len(self.calls('GetDevicePara')), 1)
+
+
+class CacheTest(ReaderTestCase):
+    """Every setter must be visible to the next (cached) get"""
+    
+    def test_set_rf_power(self):
+        self.reader.get_device_parameters()
+        self.reader.set_rf_power(12)
+        self.assertEqual(self.reader.get_device_parameters()['rf_power'], 12)
+    
+    def test_set_antenna_power(self):
+        self.reader.get_device_parameters()
+        self.reader.set_antenna_power(True, [17])
+        self.assertEqual(self.reader.get_device_parameters()['rf_power'], 17)
+    
+    def test_set_q_value(self):
+        self.reader.get_q_value()
+        self.reader.set_q_value(7)
+        self.assertEqual(self.reader.get_q_value(), 7)
+        self.assertEqual(self.reader.get_device_parameters()['q_value'], 7)
+    
+    def test_set_antenna(self):
+        self.reader.get_antenna()
+        self.reader.get_snapshot()
+        self.reader.set_antenna(0b0101)
+        self.assertEqual(self.reader.get_antenna(), 0b0101)
+        self.assertEqual(self.reader.get_device_parameters()['antenna_mask'], 0b0101)
+        self.assertEqual(self.reader.get_snapshot()['antenna'], 0b0101)
+    
+    def test_set_frequency(self):
+        self.reader.get_frequency()
+        self.reader.get_snapshot()
+        self.reader.set_frequency(Region.ETSI, 8650, 8680, 20)
+        self.assertEqual(self.reader.get_frequency()['region'], Region.ETSI)
+        self.assertEqual(self.reader.get_snapshot()['frequency']['start_freq'], 8650)
+    
+    def test_set_device_parameters(self):
+        self.reader.get_q_value()
+        self.reader.get_antenna()
+        self.reader.set_device_parameters(q_value=9, antenna_mask=0b0011)
+        self.assertEqual(self.reader.get_q_value(), 9)
+        self.assertEqual(self.reader.get_antenna(), 0b0011)
+    
+    def test_set_temperature_limit(self):
+        self.reader.get_snapshot()
+        self.reader.set_temperature_limit(65)
+        self.assertEqual(self.reader.get_snapshot()['temperature']['limit'], 65)
+    
+    def test_snapshot_sections_are_copies(self):
+        self.reader.get_snapshot()['frequency']['region'] = 99
+        self.assertNotEqual(self.reader.get_snapshot()['frequency']['region'], 99)
+
+
+class BackgroundInventoryTest(ReaderTestCase):
+    
+    def test_thread_failure_reaches_consumer(self):
+        def broken_get_tag_uii(handle, ref, timeout):
+            raise ctypes.ArgumentError('broken')
+        self.reader._get_tag_uii = broken_get_tag_uii
+        self.reader.start_inventory(background=True)
+        with self.assertRaises(ctypes.ArgumentError):
+            self.reader.get_tag(timeout=2000)
+        self.reader.stop_inventory()
+    
+    def test_concurrent_start_and_stop(self):
+        def worker(action):
+            for _ in range(20):
+                action()
+        threads = [
+            threading.Thread(target=worker, args=(
+                lambda: self.reader.start_inventory(background=True),)),
+            threading.Thread(target=worker, args=(self.reader.stop_inventory,)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.reader.stop_inventory()
+        self.assertIsNone(self.reader._bg_thread)
+        alive = [t for t in threading.enumerate() if t.name == 'CF591-inventory']
+        self.assertEqual(alive, [])
+    
+    def test_suspend_keeps_buffered_tags(self):
+        self.reader.start_inventory(background=True)
+        self.lib.tags.extend([b'\x01' * 12, b'\x02' * 12])
+        deadline = time.monotonic() + 2
+        while len(self.reader._bg_tags) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        with self.reader.inventory_suspended():
+            self.assertIsNone(self.reader._bg_thread)
+        
+        self.assertIsNotNone(self.reader._bg_thread)
+        epcs = [tag.epc_bytes for tag in self.reader.get_tags(timeout=500)]
+        self.assertEqual(epcs, [b'\x01' * 12, b'\x02' * 12])
+        self.reader.stop_inventory()
+
+
+if __name__ == '__main__':
+    unittest.main()